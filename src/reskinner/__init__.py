@@ -1,10 +1,31 @@
 from .__version__ import __version__
-from .reskinner import reskin, toggle_transparency
+from .animation import CrossfadeTransition, TclTransition, Transition
+from .cache import cache_stats, clear_caches, set_cache_size
+from .plan import ReskinPlan
+from .reskinner import (
+    compile_plan,
+    request_reskin,
+    reskin,
+    reskin_async,
+    reskin_many,
+    toggle_transparency,
+)
 from .sg import SG_LIB, sg
 
 __all__ = [
     "reskin",
+    "reskin_async",
+    "reskin_many",
+    "request_reskin",
+    "compile_plan",
+    "ReskinPlan",
     "toggle_transparency",
+    "Transition",
+    "TclTransition",
+    "CrossfadeTransition",
+    "clear_caches",
+    "cache_stats",
+    "set_cache_size",
     "__version__",
     "sg",
     "SG_LIB",
@@ -0,0 +1,769 @@
+import asyncio
+from _tkinter import DONT_WAIT, TIMER_EVENTS
+from itertools import count
+from math import ceil
+from time import perf_counter
+from tkinter import Event, Misc, TclError
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from warnings import warn
+
+from .constants import DEFAULT_CPU_BUDGET, DEFAULT_FPS, FRAME_COST_SMOOTHING
+from .easing import EasingName, ease
+from .sg import sg
+
+# Type alias for the function that renders a single frame at a given progress.
+FrameFunction = Callable[[float], None]
+
+# Type alias for the function that generates the Tcl script of a single frame.
+ScriptFunction = Callable[[float], str]
+
+# Type alias for the function that renders the final state of a transition. It may
+# return an iterator, in which case the final state is rendered one step per idle
+# callback, as the iterator is advanced.
+FinalFunction = Callable[[], Optional[Iterator[None]]]
+
+# Type alias for completion callbacks.
+CompletionCallback = Callable[["Transition"], None]
+
+# Plays precomputed frames entirely within the Tcl interpreter. Each tick evaluates the
+# frame due at the current time (skipping late frames) and reschedules itself with
+# `after`, until the duration elapses and the completion command is invoked with the
+# average cost of a frame. Like `Transition`, the player keeps a moving average of the
+# cost of a frame, spaces frames out to stay within the CPU budget, and drops the
+# frames that couldn't be rendered before the transition is due to end.
+_TCL_PLAYER = f"""
+namespace eval ::reskinner {{
+    variable frames
+    variable pending
+    variable costs
+}}
+proc ::reskinner::play {{id start duration interval budget callback}} {{
+    variable frames
+    variable pending
+    variable costs
+    set elapsed [expr {{[clock milliseconds] - $start}}]
+    set count [llength $frames($id)]
+    if {{$elapsed + $costs($id) < $duration}} {{
+        set index [expr {{min($count - 1, $elapsed * $count / $duration)}}]
+        set begin [clock microseconds]
+        if {{[catch {{uplevel #0 [lindex $frames($id) $index]}} message]}} {{
+            ::reskinner::stop $id
+            $callback $message 0
+            return
+        }}
+        set cost [expr {{([clock microseconds] - $begin) / 1000.0}}]
+        set costs($id) [expr {{$costs($id) ? $costs($id) + \\
+            {FRAME_COST_SMOOTHING} * ($cost - $costs($id)) : $cost}}]
+        set delay [expr {{min(max($interval, $costs($id) / $budget) - $cost, \\
+            $duration - $elapsed - $cost)}}]
+        set pending($id) [after [expr {{max(1, int($delay))}}] \\
+            [list ::reskinner::play $id $start $duration $interval $budget $callback]]
+        return
+    }}
+    set cost $costs($id)
+    ::reskinner::stop $id
+    $callback {{}} $cost
+}}
+proc ::reskinner::stop {{id}} {{
+    variable frames
+    variable pending
+    variable costs
+    if {{[info exists pending($id)]}} {{
+        after cancel $pending($id)
+        unset pending($id)
+    }}
+    unset -nocomplain frames($id) costs($id)
+}}
+"""
+
+# Sentinel marking the end of the steps of a final frame.
+_FINISHED = object()
+
+# Identifiers of Tcl-side transitions.
+_tcl_transition_ids = count()
+
+
+def _window_closed(error: Union[TclError, str]) -> bool:
+    """Check whether a TclError was caused by the window being destroyed.
+
+    :param error: The error raised by Tkinter (or its message)
+    :type error: Union[TclError, str]
+    :return: True if the error indicates the window no longer exists
+    :rtype: bool
+    """
+    return "invalid command name" in str(error)
+
+
+def _unbind(widget: Misc, sequence: str, funcid: str) -> None:
+    """
+    Removes a single binding of an event sequence from a widget.
+
+    Before Python 3.13, ``unbind`` removes every binding of the sequence, including
+    those made by the GUI library.
+
+    :param widget: The widget the binding was made on
+    :type widget: Misc
+    :param sequence: The event sequence
+    :type sequence: str
+    :param funcid: The identifier returned by ``bind``
+    :type funcid: str
+    """
+    script = widget.bind(sequence)
+    widget.bind(
+        sequence, "\n".join(line for line in script.split("\n") if funcid not in line)
+    )
+    widget.deletecommand(funcid)
+
+
+def _frame_count(duration: float, fps: float) -> int:
+    """
+    Get the number of frames a transition is made of at a given frame rate.
+
+    :param duration: Duration of the transition in milliseconds
+    :type duration: float
+    :param fps: Frame rate of the transition
+    :type fps: float
+    :return: The number of frames
+    :rtype: int
+    """
+    return max(1, ceil(duration / 1000 * fps))
+
+
+def _check_frame_rate(fps: float, cpu_budget: float) -> None:
+    """
+    Check the frame rate and CPU budget of a transition.
+
+    :param fps: Maximum frame rate of the transition
+    :type fps: float
+    :param cpu_budget: Fraction (0 to 1) of the main thread's time that rendering
+        frames may take
+    :type cpu_budget: float
+    :raises ValueError: If either of them is out of range
+    """
+    if not isinstance(fps, (int, float)) or fps <= 0:
+        raise ValueError("Frame rate must be a positive number")
+    if not isinstance(cpu_budget, (int, float)) or not 0 < cpu_budget <= 1:
+        raise ValueError("CPU budget must be a number between 0 and 1")
+
+
+class Transition:
+    """
+    A handle to a theme transition running on a window's Tk event loop.
+
+    Frames are scheduled with ``TKroot.after()`` instead of being rendered in a busy
+    loop, so the window keeps processing ``window.read()`` events while the transition
+    runs. Progress is measured with a monotonic clock, which means late frames are
+    simply skipped rather than slowing the transition down.
+
+    The frame rate adapts to the measured cost of a frame: frames are spaced out so
+    that rendering takes no more than ``cpu_budget`` of the main thread's time, up to
+    ``fps`` frames per second, and a frame that couldn't be rendered before the
+    transition is due to end is dropped in favor of the final frame.
+    """
+
+    def __init__(
+        self,
+        window: sg.Window,
+        render_frame: FrameFunction,
+        render_final: FinalFunction,
+        duration: float = 0,
+        fps: float = DEFAULT_FPS,
+        on_complete: Optional[CompletionCallback] = None,
+        completion_event: Optional[Any] = None,
+        cpu_budget: float = DEFAULT_CPU_BUDGET,
+    ):
+        """
+        Initializes a Transition instance.
+
+        :param window: The window whose event loop drives the transition
+        :type window: sg.Window
+        :param render_frame: Function rendering the frame at a given progress (0 to 1)
+        :type render_frame: FrameFunction
+        :param render_final: Function rendering the final state of the transition,
+            optionally in steps (by returning an iterator)
+        :type render_final: FinalFunction
+        :param duration: Duration of the transition in milliseconds
+        :type duration: float
+        :param fps: Maximum frame rate of the transition
+        :type fps: float
+        :param on_complete: Optional callback called with this handle once the
+            transition completes
+        :type on_complete: Optional[CompletionCallback]
+        :param completion_event: Optional event key written to the window (via
+            ``write_event_value``) once the transition completes
+        :type completion_event: Optional[Any]
+        :param cpu_budget: Fraction (0 to 1) of the main thread's time that rendering
+            frames may take
+        :type cpu_budget: float
+        """
+        _check_frame_rate(fps, cpu_budget)
+
+        self.window = window
+        self.duration = duration
+        self.fps = fps
+        self.on_complete = on_complete
+        self.completion_event = completion_event
+        self.cpu_budget = cpu_budget
+        self.frames: int = 0
+        # Moving average of the cost of a frame, in milliseconds.
+        self.frame_cost: Optional[float] = None
+        # Tk calls (and values within calls) skipped so far because they would have
+        # re-applied the values last applied; kept up to date by `reskin()`.
+        self.skipped_calls: int = 0
+        self.skipped_values: int = 0
+        self._render_frame = render_frame
+        self._render_final = render_final
+        self._after_id: Optional[str] = None
+        # The window's <Destroy> binding, which stops the transition if it's closed.
+        self._destroy_binding: Optional[str] = None
+        # When the next tick (or step) is due, and the method to call then.
+        self._pending: Optional[Tuple[float, Callable[[], None]]] = None
+        self._asyncio = False
+        self._start: Optional[float] = None
+        self._steps: Optional[Iterator[None]] = None
+        self._done = False
+        self._cancelled = False
+        # Called with this handle once it's done, however it ends, e.g. to forget it.
+        self._on_done: List[CompletionCallback] = []
+
+    @property
+    def done(self) -> bool:
+        """Whether the transition has completed, been finished, or been cancelled."""
+        return self._done
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the transition was cancelled before completing."""
+        return self._cancelled
+
+    @property
+    def finishing(self) -> bool:
+        """Whether the final frame is being applied, in time slices."""
+        return self._steps is not None and not self._done
+
+    @property
+    def started(self) -> bool:
+        """Whether the transition has begun (once its start delay, if any, elapsed)."""
+        return self._start is not None
+
+    @property
+    def progress(self) -> float:
+        """The linear (un-eased) progress of the transition, from 0 to 1."""
+        if self._done:
+            return 1.0
+        if self._start is None or not self.duration:
+            return 0.0
+        return min(1.0, (perf_counter() - self._start) * 1000 / self.duration)
+
+    @property
+    def frame_count(self) -> int:
+        """The number of frames the transition is made of at its target frame rate."""
+        return _frame_count(self.duration, self.fps)
+
+    @property
+    def _frame_interval(self) -> float:
+        if self.frame_cost is None:
+            return 1 / self.fps
+        return max(1 / self.fps, self.frame_cost / 1000 / self.cpu_budget)
+
+    def _measure(self, cost: float) -> None:
+        if self.frame_cost is None:
+            self.frame_cost = cost
+        else:
+            self.frame_cost += FRAME_COST_SMOOTHING * (cost - self.frame_cost)
+
+    def start(self, delay: float = 0) -> "Transition":
+        """
+        Starts the transition, optionally after a delay.
+
+        Instant transitions (and windows that have not been finalized yet) are
+        completed as soon as they begin.
+
+        :param delay: Delay in milliseconds before the transition begins
+        :type delay: float
+        :return: This handle
+        :rtype: Transition
+        """
+        if self._done or self._start is not None or self._pending is not None:
+            return self
+        if delay and self.window.TKroot:
+            self._schedule(self._begin, ceil(delay))
+        else:
+            self._begin()
+        return self
+
+    def _begin(self) -> None:
+        self._after_id = self._pending = None
+        if self._done:
+            return
+        self._start = perf_counter()
+        if not self.duration or not self.window.TKroot:
+            self._complete()
+        else:
+            self._tick()
+
+    def cancel(self) -> None:
+        """
+        Stops the transition, leaving the window in its current (intermediate) state.
+
+        The completion callback and event are not fired for cancelled transitions.
+        """
+        if self._done:
+            return
+        self._unschedule()
+        self._end(cancelled=True)
+
+    def finish(self) -> None:
+        """Stops the transition and jumps straight to its final frame."""
+        if self._done:
+            return
+        self._unschedule()
+        self._complete(drain=True)
+
+    async def play_async(self) -> "Transition":
+        """
+        Plays the transition from the running asyncio event loop, instead of Tk's.
+
+        Frames are rendered between awaits, and the window's pending redraws are
+        flushed after each one (with ``update_idletasks``), so the transition plays
+        even while nothing pumps the window's event loop. Transitions that are already
+        running are taken over. If the awaiting task is cancelled, the transition is
+        finished, leaving the window in the new theme, before ``asyncio.CancelledError``
+        propagates.
+
+        :return: This handle, once the transition is done
+        :rtype: Transition
+        """
+        self._asyncio = True
+        pending = self._pending
+        self._unschedule()
+        self._pending = pending
+        try:
+            if self._start is None:
+                self.start()
+            while not self._done and self._pending is not None:
+                self._flush()
+                due, callback = self._pending
+                await asyncio.sleep(max(0, due - perf_counter()))
+                callback()
+        except asyncio.CancelledError:
+            self.finish()
+            raise
+        finally:
+            self._flush()
+        return self
+
+    def _flush(self) -> None:
+        """Redraws the window, without processing any events."""
+        try:
+            self.window.TKroot.update_idletasks()
+        except (AttributeError, TclError):
+            # The window was closed; the next frame notices.
+            pass
+
+    def _unschedule(self) -> None:
+        self._pending = None
+        if self._after_id is not None:
+            try:
+                self.window.TKroot.after_cancel(self._after_id)
+            except (AttributeError, TclError):
+                pass
+            self._after_id = None
+
+    def _tick(self) -> None:
+        """Renders the frame due now and schedules the next one."""
+        self._after_id = self._pending = None
+        if self._done:
+            return
+
+        frame_start = perf_counter()
+        elapsed = (frame_start - self._start) * 1000
+        if elapsed + (self.frame_cost or 0) >= self.duration:
+            self._complete()
+            return
+
+        try:
+            self._render_frame(elapsed / self.duration)
+        except TclError as e:
+            if _window_closed(e):
+                warn("Window was closed during reskinning")
+                self.cancel()
+                return
+            raise
+        self.frames += 1
+        cost = (perf_counter() - frame_start) * 1000
+        self._measure(cost)
+
+        delay = min(self._frame_interval * 1000 - cost, self.duration - elapsed - cost)
+        self._schedule(self._tick, max(0, ceil(delay)))
+
+    def _schedule(self, callback: Callable[[], None], delay: Optional[int]) -> None:
+        """
+        Schedules the next tick (or step) on the event loop driving the transition.
+
+        :param callback: The method to call
+        :type callback: Callable[[], None]
+        :param delay: The delay in milliseconds, or None to call it once idle
+        :type delay: Optional[int]
+        """
+        self._pending = (perf_counter() + (delay or 0) / 1000, callback)
+        if self._asyncio:
+            return
+        try:
+            self._watch_window()
+            if delay is None:
+                # Idle callbacks scheduled from idle callbacks wait for pending events.
+                self._after_id = self.window.TKroot.after_idle(callback)
+            else:
+                self._after_id = self.window.TKroot.after(delay, callback)
+        except (AttributeError, TclError):
+            # The window was closed between frames.
+            self._end(cancelled=True)
+
+    def _watch_window(self) -> None:
+        """Makes sure the transition stops if its window is destroyed meanwhile."""
+        if self._destroy_binding is None:
+            self._destroy_binding = self.window.TKroot.bind(
+                "<Destroy>", self._on_destroy, add="+"
+            )
+
+    def _on_destroy(self, event: Event) -> None:
+        # Toplevels also get the <Destroy> events of their descendants.
+        if str(event.widget) != str(self.window.TKroot):
+            return
+        # The binding is deleted along with the window, while it's still running.
+        self._destroy_binding = None
+        if not self._done:
+            warn("Window was closed during reskinning")
+            self._unschedule()
+            self._end(cancelled=True)
+
+    def _complete(self, drain: bool = False) -> None:
+        """
+        Renders the final frame and completes the transition.
+
+        Final frames rendered in steps yield to the event loop between steps (with
+        ``after_idle``), unless drained all at once (or the window isn't finalized).
+
+        :param drain: Whether to render every remaining step right away
+        :type drain: bool
+        """
+        try:
+            if self._steps is None:
+                self._steps = self._render_final() or iter(())
+            if drain or not self.window.TKroot:
+                for _ in self._steps:
+                    pass
+            elif next(self._steps, _FINISHED) is not _FINISHED:
+                self._schedule(self._step, None)
+                return
+        except TclError as e:
+            if not _window_closed(e):
+                raise
+            warn("Window was closed during reskinning")
+            self._end(cancelled=True)
+            return
+        self._end()
+
+        if self.on_complete:
+            self.on_complete(self)
+        if self.completion_event is not None:
+            self.window.write_event_value(self.completion_event, self)
+
+    def _end(self, cancelled: bool = False) -> None:
+        """
+        Marks the transition as done.
+
+        :param cancelled: Whether it ended without completing
+        :type cancelled: bool
+        """
+        if self._done:
+            return
+        self._done = True
+        self._cancelled = cancelled
+        if self._destroy_binding is not None:
+            try:
+                _unbind(self.window.TKroot, "<Destroy>", self._destroy_binding)
+            except (AttributeError, TclError):
+                pass
+            self._destroy_binding = None
+        for callback in self._on_done:
+            callback(self)
+
+    def _step(self) -> None:
+        self._after_id = self._pending = None
+        if not self._done:
+            self._complete()
+
+
+class TclTransition(Transition):
+    """
+    A transition whose frames are precomputed and played back by the Tcl interpreter.
+
+    Every frame's colors are resolved up front into a Tcl script. Playback, including
+    frame scheduling, then happens entirely on the Tcl side with ``after``, so the
+    animation stays smooth even while the main thread is busy running Python code
+    between ``window.read()`` calls. Python is only called back once playback ends.
+    """
+
+    def __init__(
+        self,
+        window: sg.Window,
+        render_script: ScriptFunction,
+        render_final: FinalFunction,
+        duration: float = 0,
+        fps: float = DEFAULT_FPS,
+        on_complete: Optional[CompletionCallback] = None,
+        completion_event: Optional[Any] = None,
+        cpu_budget: float = DEFAULT_CPU_BUDGET,
+    ):
+        """
+        Initializes a TclTransition instance.
+
+        :param window: The window whose Tcl interpreter plays the transition
+        :type window: sg.Window
+        :param render_script: Function generating the Tcl script of the frame at a
+            given progress (0 to 1)
+        :type render_script: ScriptFunction
+        :param render_final: Function rendering the final state of the transition,
+            optionally in steps (by returning an iterator)
+        :type render_final: FinalFunction
+        :param duration: Duration of the transition in milliseconds
+        :type duration: float
+        :param fps: Maximum frame rate of the transition
+        :type fps: float
+        :param on_complete: Optional callback called with this handle once the
+            transition completes
+        :type on_complete: Optional[CompletionCallback]
+        :param completion_event: Optional event key written to the window (via
+            ``write_event_value``) once the transition completes
+        :type completion_event: Optional[Any]
+        :param cpu_budget: Fraction (0 to 1) of the main thread's time that playing
+            frames may take
+        :type cpu_budget: float
+        """
+        super().__init__(
+            window,
+            lambda _: None,
+            render_final,
+            duration,
+            fps,
+            on_complete,
+            completion_event,
+            cpu_budget,
+        )
+        self._render_script = render_script
+        self._id = next(_tcl_transition_ids)
+        self._callback: Optional[str] = None
+
+    def _tick(self) -> None:
+        tk = self.window.TKroot.tk
+        frame_count = self.frame_count
+        frames = tuple(
+            self._render_script(index / frame_count) for index in range(frame_count)
+        )
+
+        if not tk.call("info", "procs", "::reskinner::play"):
+            tk.eval(_TCL_PLAYER)
+        self._watch_window()
+        self._callback = f"::reskinner::done{self._id}"
+        tk.createcommand(self._callback, self._on_played)
+        tk.call("set", f"::reskinner::frames({self._id})", frames)
+        tk.call("set", f"::reskinner::costs({self._id})", 0)
+        self.frames = frame_count
+        # The player's clock starts now, once every frame's script is generated.
+        self._start = perf_counter()
+        tk.call(
+            "::reskinner::play",
+            self._id,
+            tk.call("clock", "milliseconds"),
+            int(self.duration),
+            max(1, int(self._frame_interval * 1000)),
+            self.cpu_budget,
+            self._callback,
+        )
+
+    async def play_async(self) -> "Transition":
+        """
+        Waits for the transition from the running asyncio event loop.
+
+        Playback still happens in Tcl, whose timers (and pending redraws) are serviced
+        between awaits, so the transition plays even while nothing pumps the window's
+        event loop. If the awaiting task is cancelled, the transition is finished,
+        leaving the window in the new theme, before ``asyncio.CancelledError``
+        propagates.
+
+        :return: This handle, once the transition is done
+        :rtype: Transition
+        """
+        try:
+            if self._start is None:
+                self.start()
+            while not self._done:
+                tk = self.window.TKroot.tk
+                while tk.dooneevent(TIMER_EVENTS | DONT_WAIT):
+                    pass
+                self._flush()
+                await asyncio.sleep(self._frame_interval)
+        except asyncio.CancelledError:
+            self.finish()
+            raise
+        except (AttributeError, TclError):
+            # The window was closed during playback.
+            self._unschedule()
+            self._end(cancelled=True)
+        finally:
+            self._flush()
+        return self
+
+    def _on_played(self, error: str, cost: str) -> None:
+        self._delete_callback()
+        if not error:
+            self.frame_cost = float(cost) or None
+            self._complete()
+            return
+        self._end(cancelled=True)
+        if _window_closed(error):
+            warn("Window was closed during reskinning")
+        else:
+            warn(f"Error during animated reskin: {error}")
+
+    def _unschedule(self) -> None:
+        super()._unschedule()
+        if self._callback is not None:
+            try:
+                self.window.TKroot.tk.call("::reskinner::stop", self._id)
+            except (AttributeError, TclError):
+                pass
+        self._delete_callback()
+
+    def _delete_callback(self) -> None:
+        if self._callback is not None:
+            try:
+                self.window.TKroot.tk.deletecommand(self._callback)
+            except (AttributeError, TclError):
+                pass
+            self._callback = None
+
+
+class CrossfadeTransition(Transition):
+    """
+    A transition that fades the whole window out and back in, instead of
+    interpolating the colors of every widget.
+
+    The new theme is applied all at once while the window is fully faded out, so each
+    frame costs a single ``wm attributes -alpha`` call no matter how many elements the
+    window has. Several windows may be faded together.
+    """
+
+    def __init__(
+        self,
+        window: sg.Window,
+        render_swap: Callable[[], None],
+        render_final: FinalFunction,
+        duration: float = 0,
+        fps: float = DEFAULT_FPS,
+        on_complete: Optional[CompletionCallback] = None,
+        completion_event: Optional[Any] = None,
+        cpu_budget: float = DEFAULT_CPU_BUDGET,
+        easing_function: Optional[Union[EasingName, Callable[[float], float]]] = None,
+        other_windows: Sequence[sg.Window] = (),
+    ):
+        """
+        Initializes a CrossfadeTransition instance.
+
+        :param window: The window to fade, on whose event loop the transition plays
+        :type window: sg.Window
+        :param render_swap: Function applying the new theme at once, halfway through
+        :type render_swap: Callable[[], None]
+        :param render_final: Function rendering the final state of the transition,
+            optionally in steps (by returning an iterator)
+        :type render_final: FinalFunction
+        :param duration: Duration of the transition in milliseconds
+        :type duration: float
+        :param fps: Maximum frame rate of the transition
+        :type fps: float
+        :param on_complete: Optional callback called with this handle once the
+            transition completes
+        :type on_complete: Optional[CompletionCallback]
+        :param completion_event: Optional event key written to the window (via
+            ``write_event_value``) once the transition completes
+        :type completion_event: Optional[Any]
+        :param cpu_budget: Fraction (0 to 1) of the main thread's time that rendering
+            frames may take
+        :type cpu_budget: float
+        :param easing_function: Optional easing function or name shaping the fade
+        :type easing_function: Optional[Union[EasingName, Callable[[float], float]]]
+        :param other_windows: Other windows faded along with ``window``
+        :type other_windows: Sequence[sg.Window]
+        """
+        super().__init__(
+            window,
+            self._fade,
+            self._render_faded_in,
+            duration,
+            fps,
+            on_complete,
+            completion_event,
+            cpu_budget,
+        )
+        self.easing_function = easing_function
+        self._render_swap = render_swap
+        self._render_final_state = render_final
+        self._swapped = False
+        self._windows = (window, *other_windows)
+        # The original alpha of each window, once the transition begins
+        self._alphas: Dict[sg.Window, float] = {}
+
+    def _begin(self) -> None:
+        if not self._done:
+            self._alphas = {
+                window: float(window.TKroot.attributes("-alpha"))
+                for window in self._windows
+                if window.TKroot
+            }
+        super()._begin()
+
+    def cancel(self) -> None:
+        if self._done:
+            return
+        super().cancel()
+        self._restore_alpha()
+
+    def _fade(self, progress: float) -> None:
+        eased = ease(progress, self.easing_function)
+        if eased >= 0.5 and not self._swapped:
+            self._swapped = True
+            self._render_swap()
+        self._set_alpha(abs(1 - 2 * eased))
+
+    def _render_faded_in(self) -> Optional[Iterator[None]]:
+        self._restore_alpha()
+        return self._render_final_state()
+
+    def _restore_alpha(self) -> None:
+        try:
+            self._set_alpha(1)
+        except TclError as e:
+            if not _window_closed(e):
+                raise
+
+    def _set_alpha(self, factor: float) -> None:
+        for window, alpha in list(self._alphas.items()):
+            try:
+                window.TKroot.attributes("-alpha", alpha * factor)
+            except TclError as e:
+                # The others keep fading if a window other than the main one is closed.
+                if window is self.window or not _window_closed(e):
+                    raise
+                del self._alphas[window]
@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, TypeVar
+
+from .constants import CACHE_SIZES
+
+T = TypeVar("T")
+
+# Sentinel for cache misses, since None is a valid cached value.
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ManagedCache:
+    """A bounded, thread-safe LRU cache that keeps hit, miss and eviction counts."""
+
+    def __init__(self, name: str, maxsize: int):
+        """
+        Initializes a ManagedCache instance.
+
+        :param name: The name the cache is registered under
+        :type name: str
+        :param maxsize: The maximum number of entries kept
+        :type maxsize: int
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._trim()
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("Cache size must be a non-negative number")
+        with self._lock:
+            self.maxsize = maxsize
+            self._trim()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self.hits, self.misses, self.evictions, len(self._entries), self.maxsize
+        )
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Registry of every managed cache, by name. Caches may be first used from worker
+# threads (e.g. by `request_reskin()`), so creating them is locked.
+_caches: Dict[str, ManagedCache] = {}
+_caches_lock = RLock()
+
+
+def get_cache(name: str) -> ManagedCache:
+    """
+    Get a managed cache by name, creating it (with its configured size) if needed.
+
+    :param name: The name of the cache
+    :type name: str
+    :return: The cache
+    :rtype: ManagedCache
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                cache = _caches[name] = ManagedCache(name, CACHE_SIZES.get(name, 128))
+    return cache
+
+
+def managed_cache(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Memoize a function in the named managed cache, keyed on its (hashable) arguments.
+
+    :param name: The name of the cache
+    :type name: str
+    :return: The decorator
+    """
+
+    def decorator(function: Callable[..., T]) -> Callable[..., T]:
+        cache = get_cache(name)
+
+        @wraps(function)
+        def wrapper(*args: Hashable) -> T:
+            value = cache.get(args, _MISSING)
+            if value is _MISSING:
+                value = function(*args)
+                cache.put(args, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def clear_caches(name: Optional[str] = None) -> None:
+    """
+    Clear Reskinner's caches (and reset their statistics).
+
+    This is worth calling after changing the default look of elements, e.g. by
+    switching the ttk theme, since default colors are cached.
+
+    :param name: The name of a single cache to clear; all caches are cleared if None
+    :type name: Optional[str]
+    """
+    if name is not None:
+        get_cache(name).clear()
+        return
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """
+    Get the statistics of every cache.
+
+    :return: The hits, misses, evictions, size and maximum size of each cache, by name
+    :rtype: Dict[str, CacheStats]
+    """
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def set_cache_size(name: str, maxsize: int) -> None:
+    """
+    Set the maximum number of entries of a cache, evicting the oldest ones if needed.
+
+    :param name: The name of the cache, e.g. "colors"
+    :type name: str
+    :param maxsize: The new maximum size
+    :type maxsize: int
+    """
+    get_cache(name).resize(maxsize)
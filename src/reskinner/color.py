@@ -0,0 +1,143 @@
+import re
+from colorsys import hls_to_rgb, rgb_to_hls
+from typing import Optional, Tuple
+
+from colour import Color
+
+# Valid hex color strings: "#rgb" or "#rrggbb".
+_HEX_COLOR = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+
+class RGBColor:
+    """
+    A lightweight, immutable color used internally on the per-frame hot path.
+
+    Components are floats from 0 to 1. Unlike ``colour.Color``, no conversions are done
+    on attribute access; the HSL components are only computed the first time they are
+    needed and are then kept, since the same endpoint colors are interpolated on every
+    frame. ``colour.Color`` is only used at the API boundary (see ``from_colour``).
+    """
+
+    __slots__ = ("red", "green", "blue", "_hsl")
+
+    def __init__(self, red: float, green: float, blue: float):
+        """
+        Initializes an RGBColor instance.
+
+        :param red: The red component, from 0 to 1
+        :type red: float
+        :param green: The green component, from 0 to 1
+        :type green: float
+        :param blue: The blue component, from 0 to 1
+        :type blue: float
+        """
+        self.red = red
+        self.green = green
+        self.blue = blue
+        self._hsl: Optional[Tuple[float, float, float]] = None
+
+    @classmethod
+    def from_hsl(cls, hue: float, saturation: float, luminance: float) -> "RGBColor":
+        """
+        Creates a color from its HSL components.
+
+        :param hue: The hue, from 0 to 1
+        :type hue: float
+        :param saturation: The saturation, from 0 to 1
+        :type saturation: float
+        :param luminance: The luminance, from 0 to 1
+        :type luminance: float
+        :return: The color
+        :rtype: RGBColor
+        """
+        color = cls(*hls_to_rgb(hue, luminance, saturation))
+        color._hsl = (hue, saturation, luminance)
+        return color
+
+    @classmethod
+    def from_hex(cls, value: str) -> Optional["RGBColor"]:
+        """
+        Parses a "#rgb" or "#rrggbb" hex color string.
+
+        :param value: The hex color string
+        :type value: str
+        :return: The color, or None if the string isn't a valid hex color
+        :rtype: Optional[RGBColor]
+        """
+        match = _HEX_COLOR.fullmatch(value)
+        if match is None:
+            return None
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        packed = int(digits, 16)
+        return cls(
+            (packed >> 16) / 255, ((packed >> 8) & 0xFF) / 255, (packed & 0xFF) / 255
+        )
+
+    @classmethod
+    def from_colour(cls, color: Color) -> "RGBColor":
+        """
+        Converts a ``colour.Color`` object.
+
+        :param color: The color to convert
+        :type color: Color
+        :return: The converted color
+        :rtype: RGBColor
+        """
+        return cls(*color.get_rgb())
+
+    @property
+    def rgb(self) -> Tuple[float, float, float]:
+        return self.red, self.green, self.blue
+
+    @property
+    def hsl(self) -> Tuple[float, float, float]:
+        if self._hsl is None:
+            hue, luminance, saturation = rgb_to_hls(self.red, self.green, self.blue)
+            self._hsl = (hue, saturation, luminance)
+        return self._hsl
+
+    @property
+    def hue(self) -> float:
+        return self.hsl[0]
+
+    @property
+    def saturation(self) -> float:
+        return self.hsl[1]
+
+    @property
+    def luminance(self) -> float:
+        return self.hsl[2]
+
+    def get_hex_l(self) -> str:
+        """
+        Formats the color as a "#rrggbb" hex string.
+
+        :return: The hex string
+        :rtype: str
+        """
+        red = int(self.red * 255 + 0.5)
+        green = int(self.green * 255 + 0.5)
+        blue = int(self.blue * 255 + 0.5)
+        return f"#{red:02x}{green:02x}{blue:02x}"
+
+    def to_colour(self) -> Color:
+        """
+        Converts the color to a ``colour.Color`` object.
+
+        :return: The converted color
+        :rtype: Color
+        """
+        return Color(rgb=self.rgb)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RGBColor):
+            return NotImplemented
+        return self.rgb == other.rgb
+
+    def __hash__(self) -> int:
+        return hash(self.rgb)
+
+    def __repr__(self) -> str:
+        return f"RGBColor({self.get_hex_l()!r})"
@@ -1,14 +1,14 @@
-from functools import lru_cache
 from tkinter import Widget
 from tkinter.ttk import Style
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union
 
 from colour import Color
 
 from ._compat import Literal, Type
-from .constants import LRU_MAX_SIZE
+from .cache import get_cache, managed_cache
+from .color import RGBColor
 from .default_window import DEFAULT_ELEMENTS, DEFAULT_WINDOW
-from .easing import EasingName, ease
+from .easing import EasingName, ease, mirror_easing
 from .interpolation import INTERPOLATION_MODES, InterpolationMethod
 from .sg import sg
 
@@ -25,6 +25,49 @@ ThemeConfiguration = Dict[str, ThemeDictColorKey]
 ElementFilter = Callable[[sg.Element], bool]  # type: ignore[valid-type]
 
 
+@managed_cache("colors")
+def _parse_color(value: str) -> Optional[RGBColor]:
+    """
+    Parse a color string, returning None if it isn't a valid color.
+
+    Hex strings are parsed directly; anything else (such as color names) goes through
+    the colour module. The parsed colors are cached.
+
+    :param value: The color string to parse
+    :type value: str
+    :return: The parsed color, or None
+    :rtype: Optional[RGBColor]
+    """
+    if not isinstance(value, str):
+        return None
+    if value.startswith("#"):
+        return RGBColor.from_hex(value)
+    try:
+        return RGBColor.from_colour(Color(value))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _to_color(value: Union[str, Color, RGBColor]) -> RGBColor:
+    """
+    Convert a color string or ``colour.Color`` object to the internal color type.
+
+    :param value: The color to convert
+    :type value: Union[str, Color, RGBColor]
+    :return: The converted color
+    :rtype: RGBColor
+    :raises ValueError: If the value isn't a valid color
+    """
+    if isinstance(value, RGBColor):
+        return value
+    if isinstance(value, Color):
+        return RGBColor.from_colour(value)
+    color = _parse_color(value)
+    if color is None:
+        raise ValueError(f"Invalid color: {value!r}")
+    return color
+
+
 def _is_valid_color(color: str) -> bool:
     """Check if a color string is valid.
 
@@ -36,21 +79,17 @@ def _is_valid_color(color: str) -> bool:
     if not color or not isinstance(color, str):
         return False
 
-    try:
-        # Try to create a Color object and get its hex representation
-        Color(color).get_hex_l()
-        return True
-    except (ValueError, AttributeError):
-        return False
+    return _parse_color(color) is not None
 
 
-def _normalize_tk_color(tk_color: str) -> Color:
-    """Convert a Tkinter color to a Color object.
+@managed_cache("tk_colors")
+def _normalize_tk_color(tk_color: str) -> RGBColor:
+    """Convert a Tkinter color to a color object.
 
     :param tk_color: The Tkinter color string to convert
     :type tk_color: str
-    :return: A Color object representing the input color
-    :rtype: Color
+    :return: A color object representing the input color
+    :rtype: RGBColor
     :raises RuntimeError: If default window is not properly initialized
     :raises ValueError: If the color cannot be converted
     """
@@ -60,34 +99,32 @@ def _normalize_tk_color(tk_color: str) -> Color:
     try:
         # Get RGB values from Tkinter (0-65535 range)
         rgb = DEFAULT_WINDOW.TKroot.winfo_rgb(tk_color)
-        # Convert to 0-1 range expected by Color
-        normalized = tuple(x / 65535 for x in rgb)
-
-        result = Color()
-        result.set_rgb(normalized)
-        return result
+        # Convert to 0-1 range expected by RGBColor
+        return RGBColor(*(x / 65535 for x in rgb))
     except Exception as e:
         raise ValueError(f"Failed to normalize Tk color '{tk_color}': {e}") from e
 
 
-@lru_cache(maxsize=LRU_MAX_SIZE)
 def _safe_color(
     value: Union[str, type(sg.COLOR_SYSTEM_DEFAULT)],  # type: ignore[valid-type]
     default_color_function: Callable[[], str],
-) -> Color:
-    """Safely convert a color value to a Color object, with caching.
+) -> RGBColor:
+    """Safely convert a color value to a color object.
+
+    Both the parsing of the value and the normalization of the default color are
+    cached, keyed on the color strings themselves.
 
     :param value: The color value to convert
     :type value: Union[str, type(sg.COLOR_SYSTEM_DEFAULT)]
     :param default_color_function: Function to get default color if conversion fails
     :type default_color_function: Callable[[], str]
-    :return: The converted Color object
-    :rtype: Color
+    :return: The converted color object
+    :rtype: RGBColor
     """
-    try:
-        return Color(value)
-    except ValueError:
+    color = _parse_color(value)
+    if color is None:
         return _normalize_tk_color(default_color_function())
+    return color
 
 
 def _default_window_cget(attribute: str) -> Any:
@@ -103,7 +140,7 @@ def _default_window_cget(attribute: str) -> Any:
     return DEFAULT_WINDOW.TKroot[attribute]
 
 
-@lru_cache(maxsize=LRU_MAX_SIZE)
+@managed_cache("element_defaults")
 def _default_element_cget(element_class: Type, attribute: str) -> Union[str, Widget]:
     """
     Get the default value for an element's attribute.
@@ -157,8 +194,8 @@ def _get_checkbox_radio_selectcolor(background_color, text_color) -> str:
     # due to floating point truncation, so I can't use the color module's functionality for everything here.
     if not all([_is_valid_color(background_color), _is_valid_color(text_color)]):
         return _default_element_cget(sg.Checkbox, "selectcolor") or "black"
-    background_color: str = Color(background_color).get_hex_l()
-    text_color: str = Color(text_color).get_hex_l()
+    background_color: str = _parse_color(background_color).get_hex_l()
+    text_color: str = _parse_color(text_color).get_hex_l()
     background_hsl: Tuple[float, float, float] = sg._hex_to_hsl(background_color)
     text_hsl: Tuple[float, float, float] = sg._hex_to_hsl(text_color)
     l_delta: float = (
@@ -173,7 +210,7 @@ def _get_checkbox_radio_selectcolor(background_color, text_color) -> str:
     return result
 
 
-@lru_cache(maxsize=LRU_MAX_SIZE)
+@managed_cache("combo_popdown_defaults")
 def _default_combo_popdown_cget(attribute: str) -> str:
     """Get a combobox popdown attribute using cget.
 
@@ -191,6 +228,121 @@ def _default_combo_popdown_cget(attribute: str) -> str:
     return DEFAULT_WINDOW.TKroot.tk.call("eval", f"$defaultcombo.f.l cget -{attribute}")
 
 
+def _theme_dict_values(
+    old_theme_dict: ThemeDict, new_theme_dict: ThemeDict, key: ThemeDictColorKey
+) -> Tuple[str, str]:
+    """
+    Get the start and end values referenced by a theme dict color key.
+
+    Internal use only.
+
+    :param old_theme_dict: The theme dict being transitioned from
+    :type old_theme_dict: ThemeDict
+    :param new_theme_dict: The theme dict being transitioned to
+    :type new_theme_dict: ThemeDict
+    :param key: The theme dict color key, e.g. "BACKGROUND" or ("BUTTON", 0)
+    :type key: ThemeDictColorKey
+    :return: The start and end values of the key
+    :rtype: Tuple[str, str]
+    :raises ValueError: If the key doesn't reference a pair of color strings
+    """
+    if isinstance(key, str):
+        start, end = old_theme_dict[key], new_theme_dict[key]
+    elif isinstance(key, tuple):
+        key, index = key
+        old, new = old_theme_dict[key], new_theme_dict[key]
+        if not (isinstance(old, tuple) and isinstance(new, tuple)):
+            raise ValueError("Invalid theme_dict key")
+        start, end = old[index], new[index]
+    else:
+        raise ValueError("Invalid theme_dict key")
+
+    if not (isinstance(start, str) and isinstance(end, str)):
+        raise ValueError("Invalid theme_dict key")
+    return start, end
+
+
+def _theme_dict_color_keys(
+    old_theme_dict: ThemeDict, new_theme_dict: ThemeDict
+) -> List[ThemeDictColorKey]:
+    """
+    List every color key (including tuple indices) shared by two theme dicts.
+
+    Internal use only.
+
+    :param old_theme_dict: The theme dict being transitioned from
+    :type old_theme_dict: ThemeDict
+    :param new_theme_dict: The theme dict being transitioned to
+    :type new_theme_dict: ThemeDict
+    :return: The color keys, e.g. ["BACKGROUND", ("BUTTON", 0), ("BUTTON", 1), ...]
+    :rtype: List[ThemeDictColorKey]
+    """
+    keys: List[ThemeDictColorKey] = []
+    for key, new in new_theme_dict.items():
+        old = old_theme_dict.get(key)
+        if isinstance(old, str) and isinstance(new, str):
+            keys.append(key)
+        elif isinstance(old, tuple) and isinstance(new, tuple):
+            keys.extend(
+                (key, index)
+                for index in range(min(len(old), len(new)))
+                if isinstance(old[index], str) and isinstance(new[index], str)
+            )
+    return keys
+
+
+# The palette key of the derived checkbox/radio `selectcolor`.
+CHECKBOX_SELECTCOLOR = "CHECKBOX_SELECTCOLOR"
+
+# Type alias for a resolved palette, mapping color keys to hex strings (or None, for
+# keys that reference values which aren't valid colors).
+Palette = Dict[ThemeDictColorKey, Optional[str]]
+
+
+class Timeline:
+    """
+    The precomputed palettes of a transition, at evenly spaced frames.
+
+    Timelines are cached (see ``Colorizer.precompute``), so transitions between themes
+    that were already transitioned between only replay stored hex strings.
+    """
+
+    __slots__ = ("palettes",)
+
+    def __init__(self, palettes: Tuple[Palette, ...]):
+        """
+        Initializes a Timeline instance.
+
+        :param palettes: The palettes of every frame, from progress 0 to 1 (inclusive)
+        :type palettes: Tuple[Palette, ...]
+        """
+        self.palettes = palettes
+
+    def __len__(self) -> int:
+        return len(self.palettes)
+
+    def palette(self, progress: float) -> Palette:
+        """
+        Gets the palette of the frame nearest to the given progress.
+
+        :param progress: The progress of the transition, from 0 to 1
+        :type progress: float
+        :return: The palette of that frame
+        :rtype: Palette
+        """
+        last = len(self.palettes) - 1
+        return self.palettes[min(last, max(0, int(progress * last + 0.5)))]
+
+    def reversed(self) -> "Timeline":
+        """
+        Gets the timeline played backwards.
+
+        :return: The reversed timeline
+        :rtype: Timeline
+        """
+        return Timeline(self.palettes[::-1])
+
+
 class Colorizer:
     def __init__(
         self,
@@ -202,15 +354,176 @@ class Colorizer:
     ):
         self.old_theme_dict: ThemeDict = _run_progressbar_computation(old_theme_dict)
         self.new_theme_dict: ThemeDict = _run_progressbar_computation(new_theme_dict)
-        self.progress: float = progress
-        self.styler: Style = Style()
+        # Created on first use, so that colorizers can be built off the GUI thread.
+        self._styler: Optional[Style] = None
+        self.interpolation_mode = interpolation_mode
         self.interpolate: InterpolationMethod = INTERPOLATION_MODES[interpolation_mode]
         self.easing_function = easing_function
+        # The start and end colors of every key are parsed once, up front.
+        self._endpoints: Dict[ThemeDictColorKey, Tuple[Optional[RGBColor], ...]] = {
+            key: tuple(
+                map(
+                    _parse_color,
+                    _theme_dict_values(self.old_theme_dict, self.new_theme_dict, key),
+                )
+            )
+            for key in _theme_dict_color_keys(self.old_theme_dict, self.new_theme_dict)
+        }
+        self.changed_keys: Set[ThemeDictColorKey] = self._diff()
+        self.palette: Palette = {}
+        self.timeline: Optional[Timeline] = None
+        self._fallbacks: Dict[Tuple[ThemeDictColorKey, str], str] = {}
+        self.progress = progress
+
+    def _diff(self) -> Set[ThemeDictColorKey]:
+        """
+        Finds the keys whose colors differ between the old and new theme dicts.
+
+        :return: The changed keys, including derived ones
+        :rtype: Set[ThemeDictColorKey]
+        """
+        changed: Set[ThemeDictColorKey] = set()
+        for key, (start, end) in self._endpoints.items():
+            if start is None or end is None:
+                # Compare the raw values of keys that aren't valid colors.
+                old, new = _theme_dict_values(
+                    self.old_theme_dict, self.new_theme_dict, key
+                )
+                if old != new:
+                    changed.add(key)
+            elif start.get_hex_l() != end.get_hex_l():
+                changed.add(key)
+        if changed & {"BACKGROUND", "TEXT"}:
+            changed.add(CHECKBOX_SELECTCOLOR)
+        return changed
+
+    @property
+    def styler(self) -> Style:
+        if self._styler is None:
+            self._styler = Style()
+        return self._styler
+
+    @property
+    def progress(self) -> float:
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress: float) -> None:
+        """Sets the progress of the transition and resolves that frame's palette."""
+        self._progress = progress
+        self.palette = (
+            self.timeline.palette(progress)
+            if self.timeline is not None
+            else self.resolve_palette(progress)
+        )
+        self._fallbacks = {}
+
+    def resolve_palette(self, progress: float) -> Palette:
+        """
+        Resolves every theme color at the given progress.
+
+        Each distinct key (and tuple index) is interpolated exactly once, along with
+        the colors derived from them, so that element handlers only need dict lookups.
+
+        :param progress: The progress of the transition, from 0 to 1
+        :type progress: float
+        :return: The resolved palette
+        :rtype: Palette
+        """
+        eased = ease(progress, self.easing_function)
+        palette: Palette = {
+            key: (
+                self.interpolate(start, end, eased).get_hex_l()
+                if start is not None and end is not None
+                else None
+            )
+            for key, (start, end) in self._endpoints.items()
+        }
+        background, text = palette.get("BACKGROUND"), palette.get("TEXT")
+        palette[CHECKBOX_SELECTCOLOR] = (
+            _get_checkbox_radio_selectcolor(background, text)
+            if background is not None and text is not None
+            else None
+        )
+        return palette
+
+    def snapshot(self) -> ThemeDict:
+        """
+        Builds a theme dict of the colors of the current palette.
+
+        This is what a transition that is interrupted midway leaves on screen, which
+        the next transition can start from. Values that aren't colors are taken from
+        the old theme dict (or the new one, once the transition is complete).
+
+        :return: The theme dict
+        :rtype: ThemeDict
+        """
+        theme_dict = dict(
+            self.new_theme_dict if self.progress >= 1 else self.old_theme_dict
+        )
+        for key, value in self.palette.items():
+            if value is None or key == CHECKBOX_SELECTCOLOR:
+                continue
+            if isinstance(key, tuple):
+                name, index = key
+                values = list(theme_dict[name])
+                values[index] = value
+                theme_dict[name] = tuple(values)
+            else:
+                theme_dict[key] = value
+        return theme_dict
+
+    def precompute(self, frame_count: int) -> Timeline:
+        """
+        Resolves the palettes of every frame of the transition up front.
+
+        Timelines are kept in the "timelines" cache, keyed on the colors being
+        transitioned between, the interpolation mode, the easing and the frame count.
+        When only the timeline of the opposite transition is cached (e.g. when
+        toggling back from a dark theme to a light one), it is reused in reverse
+        with the mirrored easing, provided the easing is a named one.
+
+        :param frame_count: The number of frames of the transition
+        :type frame_count: int
+        :return: The timeline, which is also used by the colorizer from then on
+        :rtype: Timeline
+        """
+        cache = get_cache("timelines")
+        key = (
+            frozenset(self._endpoints.items()),
+            self.interpolation_mode,
+            self.easing_function,
+            frame_count,
+        )
+        timeline = cache.get(key)
+        if timeline is None and not callable(self.easing_function):
+            reverse_key = (
+                frozenset(
+                    (color_key, (end, start))
+                    for color_key, (start, end) in self._endpoints.items()
+                ),
+                self.interpolation_mode,
+                mirror_easing(self.easing_function),
+                frame_count,
+            )
+            reverse = cache.get(reverse_key)
+            if reverse is not None:
+                timeline = reverse.reversed()
+        if timeline is None:
+            timeline = Timeline(
+                tuple(
+                    self.resolve_palette(index / frame_count)
+                    for index in range(frame_count + 1)
+                )
+            )
+        cache.put(key, timeline)
+        self.timeline = timeline
+        return timeline
 
     def color(self, start: Union[str, Color], end: Union[str, Color]) -> str:
         return self.interpolate(
-            Color(start),
-            Color(end),
+            _to_color(start),
+            _to_color(end),
             ease(self.progress, self.easing_function),
         ).get_hex_l()
 
@@ -219,27 +532,29 @@ class Colorizer:
         key: ThemeDictColorKey,
         default_color_function: Callable[[], str],
     ) -> str:
-        if isinstance(key, str):
-            start, end = self.old_theme_dict[key], self.new_theme_dict[key]
-        elif isinstance(key, tuple):
-            key, index = key
-            old, new = self.old_theme_dict[key], self.new_theme_dict[key]
-            if not (isinstance(old, tuple) and isinstance(new, tuple)):
-                raise ValueError("Invalid theme_dict key")
-            start, end = old[index], new[index]
-        else:
-            raise ValueError("Invalid theme_dict key")
-
-        if not (isinstance(start, str) and isinstance(end, str)):
-            raise ValueError("Invalid theme_dict key")
-
-        try:
-            _start = _safe_color(start, default_color_function)
-            _end = _safe_color(end, default_color_function)
-        except ValueError:
-            raise ValueError("The referenced theme_dict value is not a valid color.")
-
-        return self.color(_start, _end)
+        value = self.palette.get(key)
+        if value is not None:
+            return value
+
+        # The key references a value that isn't a valid color (such as
+        # sg.COLOR_SYSTEM_DEFAULT), so the default color has to stand in for it.
+        default = default_color_function()
+        if key == CHECKBOX_SELECTCOLOR:
+            return default
+        fallback_key = (key, default)
+        if fallback_key not in self._fallbacks:
+            start, end = _theme_dict_values(
+                self.old_theme_dict, self.new_theme_dict, key
+            )
+            try:
+                _start = _safe_color(start, default_color_function)
+                _end = _safe_color(end, default_color_function)
+            except ValueError:
+                raise ValueError(
+                    "The referenced theme_dict value is not a valid color."
+                )
+            self._fallbacks[fallback_key] = self.color(_start, _end)
+        return self._fallbacks[fallback_key]
 
     def configure(
         self,
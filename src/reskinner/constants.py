@@ -5,7 +5,29 @@ from .sg import sg
 
 ALTER_MENU_ACTIVE_COLORS = True
 DEFAULT_THEME_NAME = "GrayGrayGray"
-LRU_MAX_SIZE = 10
+DEFAULT_FPS = 60
+# Fraction of the main thread's time that animated transitions may spend rendering.
+DEFAULT_CPU_BUDGET = 0.5
+# Weight of the latest measurement in the moving average of the cost of a frame.
+FRAME_COST_SMOOTHING = 0.3
+# With `transition_mode="auto"`, windows with more elements than this (or whose frames
+# were measured to cost more than this many milliseconds) are cross-faded instead.
+CROSSFADE_ELEMENT_THRESHOLD = 300
+CROSSFADE_FRAME_COST_THRESHOLD = 50
+
+# Maximum number of entries of each managed cache (see `cache.py`).
+CACHE_SIZES = {
+    # Parsed color strings
+    "colors": 512,
+    # Tk color names normalized through `winfo_rgb`
+    "tk_colors": 128,
+    # Default attribute values of element classes
+    "element_defaults": 1024,
+    # Default attribute values of combo popdowns
+    "combo_popdown_defaults": 32,
+    # Precomputed palettes of whole transitions
+    "timelines": 8,
+}
 
 
 class InterpolationMode(StrEnum):
@@ -40,6 +62,19 @@ NON_GENERIC_ELEMENTS = [
     sg.VerticalSeparator,
 ]
 
+# Elements that snap to the final frame of animated transitions by default, since
+# they're small or seldom seen while the transition plays.
+SNAPPING_ELEMENTS = (
+    sg.HorizontalSeparator,
+    sg.Menu,
+    sg.Sizegrip,
+    sg.VerticalSeparator,
+)
+
+# Key of element metadata dicts overriding the level of detail of an element, with
+# either "animate" (animate everything) or "snap" (snap to the final frame).
+LEVEL_OF_DETAIL_METADATA_KEY = "reskinner_lod"
+
 _COLOR_MAPPING = {
     "Background Color": "BACKGROUND",
     "Button Background Color": ("BUTTON", 1),
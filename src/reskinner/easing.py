@@ -153,3 +153,27 @@ def ease(
 
     else:
         raise ValueError("Invalid value passed for easing function")
+
+
+def mirror_easing(function: Optional[EasingName]) -> Optional[EasingName]:
+    """
+    Get the easing that plays the given one backwards.
+
+    The mirror ``m`` of an easing ``f`` satisfies ``m(x) == 1 - f(1 - x)``, so a
+    transition from A to B eased with ``f`` matches, frame for frame, a transition
+    from B to A eased with ``m`` played in reverse. "ease_in" and "ease_out" easings
+    mirror each other, while "ease_in_out" easings (and linear progress) are their
+    own mirrors.
+
+    :param function: The name of the easing function, or None for linear progress
+    :type function: Optional[EasingName]
+    :return: The name of the mirrored easing function, or None for linear progress
+    :rtype: Optional[EasingName]
+    """
+    if function is None or function.startswith("ease_in_out_"):
+        return function
+    if function not in EASING_FUNCTIONS:
+        raise ValueError(f"Unknown easing function: {function}")
+    if function.startswith("ease_in_"):
+        return function.replace("ease_in_", "ease_out_", 1)  # type: ignore[return-value]
+    return function.replace("ease_out_", "ease_in_", 1)  # type: ignore[return-value]
@@ -1,21 +1,387 @@
-from functools import partial
+from contextlib import contextmanager
+from itertools import count
+from time import perf_counter
 from tkinter import Canvas as TKCanvas
 from tkinter import Frame as TKFrame
 from tkinter import Menu as TKMenu
+from tkinter import TclError
+from tkinter.ttk import Style
 from tkinter.ttk import Widget as TTKWidget
-from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from .colorizer import (
+    CHECKBOX_SELECTCOLOR,
     Colorizer,
     ThemeConfiguration,
     _default_combo_popdown_cget,
     _default_element_cget,
-    _get_checkbox_radio_selectcolor,
+    _parse_color,
+)
+from .constants import (
+    ALTER_MENU_ACTIVE_COLORS,
+    LEVEL_OF_DETAIL_METADATA_KEY,
+    SNAPPING_ELEMENTS,
+    ScrollbarColorKey,
 )
-from .constants import ALTER_MENU_ACTIVE_COLORS, ScrollbarColorKey
 from .default_window import DEFAULT_ELEMENTS
+from .plan import (
+    Gate,
+    Operation,
+    ReskinPlan,
+    StyleMapOperation,
+    StyleOperation,
+    TagOperation,
+    VisibilityGate,
+    WidgetOperation,
+    _options,
+    _tcl_command,
+)
 from .sg import sg
 
+# Releases the given tags' colors, so that the rows carrying them show the style's.
+_RELEASE_ROW_TAGS = """{tree tags options} {
+    foreach tag $tags {$tree tag configure $tag {*}$options}
+}"""
+
+# The rows (tree_ids) of each table whose base color tags were already released.
+_released_rows: "WeakKeyDictionary[sg.Table, List[str]]" = WeakKeyDictionary()
+
+
+def _release_row_tags(table: sg.Table) -> None:
+    """
+    Clear the base row colors PySimpleGUI sets through per-row tags.
+
+    ``Table.update()`` gives each row a tag colored with the table's background and
+    text colors. Those colors are a copy of the style's, so clearing them makes the rows
+    inherit the style's colors instead, and the reskin then only needs to reconfigure
+    the style, regardless of the number of rows. This is done once per set of rows;
+    alternating row colors and user row colors are left intact.
+
+    Internal use only.
+
+    :param table: The table whose row tags to release
+    :type table: sg.Table
+    """
+    if _released_rows.get(table) is table.tree_ids:
+        return
+    _released_rows[table] = table.tree_ids
+
+    custom = {str(row_def[0]) for row_def in table.RowColors or ()}
+    alternating = (
+        {str(row) for row in range(0, len(table.Values or ()), 2)}
+        if table.AlternatingRowColor not in (None, sg.COLOR_SYSTEM_DEFAULT)
+        else set()
+    )
+    base = [tag for tag in map(str, table.tree_ids) if tag not in custom]
+    tree = table.TKTreeview
+    for tags, options in (
+        (
+            [tag for tag in base if tag not in alternating],
+            ("-background", "", "-foreground", ""),
+        ),
+        ([tag for tag in base if tag in alternating], ("-foreground", "")),
+    ):
+        if tags:
+            tree.tk.call("apply", _RELEASE_ROW_TAGS, str(tree), tags, options)
+
+
+def _themed_tags(tree: sg.Tree) -> Dict[str, ThemeConfiguration]:
+    """
+    Find the tags of a tree that color nodes with the tree's own colors.
+
+    Tree nodes inherit their colors from the tree's style unless they carry tags that
+    set colors of their own. Tags which merely repeat the tree's background or text
+    color are bound to the corresponding theme colors, so the nodes carrying them are
+    recolored along with the tree. The cost depends on the number of tags, not nodes.
+
+    Internal use only.
+
+    :param tree: The tree whose tags to inspect
+    :type tree: sg.Tree
+    :return: The theme configuration of each themed tag
+    :rtype: Dict[str, ThemeConfiguration]
+    """
+    treeview = tree.TKTreeview
+    try:
+        tags = treeview.tk.splitlist(treeview.tk.call(treeview, "tag", "names"))
+    except TclError:
+        # Tk 8.5 can't list tags.
+        return {}
+
+    colors = {
+        "background": (_parse_color(tree.BackgroundColor), "BACKGROUND"),
+        "foreground": (_parse_color(tree.TextColor), "TEXT"),
+    }
+    themed: Dict[str, ThemeConfiguration] = {}
+    for tag in map(str, tags):
+        configuration: ThemeConfiguration = {}
+        for option, (color, key) in colors.items():
+            value = treeview.tag_configure(tag, option)
+            if color is not None and value and _parse_color(str(value)) == color:
+                configuration[option] = key
+        if configuration:
+            themed[tag] = configuration
+    return themed
+
+
+# Lists the type of every entry of a menu, in a single call.
+_MENU_ENTRY_TYPES = """{menu} {
+    set last [$menu index end]
+    if {$last in {none {}}} {return {}}
+    set types {}
+    for {set index 0} {$index <= $last} {incr index} {
+        lappend types [$menu type $index]
+    }
+    return $types
+}"""
+
+# The options supported by each type of menu entry, which are the same for every
+# menu, so each type is only ever probed once.
+_menu_entry_options: Dict[str, FrozenSet[str]] = {}
+
+
+def _menu_schema(menu: TKMenu) -> List[Tuple[int, FrozenSet[str]]]:
+    """
+    Get the options supported by each entry of a menu.
+
+    Internal use only.
+
+    :param menu: The menu to inspect
+    :type menu: TKMenu
+    :return: The index and supported options of each entry
+    :rtype: List[Tuple[int, FrozenSet[str]]]
+    """
+    schema = []
+    types = menu.tk.splitlist(menu.tk.call("apply", _MENU_ENTRY_TYPES, str(menu)))
+    for index, entry_type in enumerate(map(str, types)):
+        if entry_type not in _menu_entry_options:
+            _menu_entry_options[entry_type] = frozenset(
+                menu.entryconfigure(index).keys()
+            )
+        schema.append((index, _menu_entry_options[entry_type]))
+    return schema
+
+
+def _menu_posted(menu: TKMenu) -> Callable[[], bool]:
+    """Get a gate telling whether a (popup or dropdown) menu is posted."""
+    return lambda: bool(menu.winfo_ismapped())
+
+
+def _final_frame_only() -> bool:
+    """A gate that is never open, deferring operations to the final frame."""
+    return False
+
+
+# The popdown window of each combo, once it exists.
+_combo_popdowns: "WeakKeyDictionary[sg.Combo, str]" = WeakKeyDictionary()
+
+# The original -postcommand of each combo whose popdown is reskinned lazily.
+_combo_postcommands: "WeakKeyDictionary[sg.Combo, str]" = WeakKeyDictionary()
+
+# Configures the listbox of a combo's popdown, creating the popdown if needed.
+_CONFIGURE_POPDOWN = """{combo args} {
+    [ttk::combobox::PopdownWindow $combo].f.l configure {*}$args
+}"""
+
+
+def _combo_popdown(combo: sg.Combo) -> Optional[str]:
+    """
+    Get the path of a combo's popdown window, if it was ever created.
+
+    Ttk only creates popdowns the first time they are opened, and looking one up with
+    ``ttk::combobox::PopdownWindow`` creates it, so its existence is checked first.
+
+    Internal use only.
+
+    :param combo: The combo
+    :type combo: sg.Combo
+    :return: The path of the popdown window, or None if it doesn't exist yet
+    :rtype: Optional[str]
+    """
+    if combo not in _combo_popdowns:
+        widget = combo.widget
+        # Ttk names popdowns after their combos.
+        if not widget.tk.getboolean(
+            widget.tk.call("winfo", "exists", f"{widget}.popdown")
+        ):
+            return None
+        _combo_popdowns[combo] = str(
+            widget.tk.call("ttk::combobox::PopdownWindow", widget)
+        )
+    return _combo_popdowns[combo]
+
+
+def _configure_popdown_on_post(combo: sg.Combo) -> Callable[..., None]:
+    """
+    Get a function that configures a combo's popdown the next time it is opened.
+
+    The configuration is run by the combo's ``-postcommand``, ahead of any command the
+    combo already had.
+
+    Internal use only.
+
+    :param combo: The combo
+    :type combo: sg.Combo
+    :return: The function, taking the popdown listbox's configuration as keywords
+    :rtype: Callable[..., None]
+    """
+    widget = combo.widget
+
+    def _configure(**configuration: str) -> None:
+        if combo not in _combo_postcommands:
+            _combo_postcommands[combo] = str(widget.cget("postcommand"))
+        script = _tcl_command(
+            ["apply", _CONFIGURE_POPDOWN, str(widget), *_options(configuration)]
+        )
+        widget.configure(postcommand=f"{script}\n{_combo_postcommands[combo]}")
+
+    return _configure
+
+
+# Identifiers of the shared styles created so far.
+_shared_style_ids = count(1)
+
+# The names of the shared styles created so far.
+_shared_styles: Set[str] = set()
+
+
+def _base_style(style: str) -> str:
+    """
+    Get the built-in ttk style a style name derives from, e.g. "Vertical.TScrollbar".
+
+    Internal use only.
+
+    :param style: The style name, e.g. "12___-KEY-.Vertical.TScrollbar"
+    :type style: str
+    :return: The base style name
+    :rtype: str
+    """
+    parts = style.split(".")
+    if len(parts) > 1 and parts[-2] in ("Horizontal", "Vertical"):
+        return ".".join(parts[-2:])
+    return parts[-1]
+
+
+def _style_signature(styler: Style, style: str) -> Tuple[Any, ...]:
+    """
+    Get a hashable summary of a style's configuration and state maps.
+
+    Internal use only.
+
+    :param styler: The ttk Style object
+    :type styler: Style
+    :param style: The style name
+    :type style: str
+    :return: The configuration and maps of the style
+    :rtype: Tuple[Any, ...]
+    """
+    configuration = styler.configure(style) or {}
+    maps = styler.map(style) or {}
+    return (
+        frozenset((option, str(value)) for option, value in configuration.items()),
+        frozenset(
+            (option, tuple(map(str, specification)))
+            for option, specifications in maps.items()
+            for specification in specifications
+        ),
+    )
+
+
+def _copy_style(styler: Style, source: str, target: str) -> None:
+    """
+    Copy a style's configuration and state maps to another style.
+
+    Internal use only.
+
+    :param styler: The ttk Style object
+    :type styler: Style
+    :param source: The style to copy
+    :type source: str
+    :param target: The style to copy it to
+    :type target: str
+    """
+    configuration = styler.configure(source)
+    if configuration:
+        styler.configure(target, **configuration)
+    maps = styler.map(source)
+    if maps:
+        styler.map(target, **maps)
+
+
+class _Visibility:
+    """
+    Finds out which widgets are viewable while compiling a plan.
+
+    Operations on widgets that aren't viewable (in unselected tabs, hidden or collapsed
+    elements, or withdrawn and iconified windows) are gated on the viewability of the
+    outermost hidden widget containing them. A single check per frame then covers a
+    whole hidden tab, and its operations resume as soon as it is shown; otherwise they
+    only run on the final frame.
+    """
+
+    def __init__(self):
+        self._viewable: Dict[str, bool] = {}
+        self._roots: Dict[str, str] = {}
+        self._gates: Dict[str, Gate] = {}
+
+    def viewable(self, tk: Any, path: str) -> bool:
+        if path not in self._viewable:
+            try:
+                viewable = tk.getboolean(tk.call("winfo", "viewable", path))
+            except TclError:
+                # Don't hold back updates of anything that can't be checked.
+                viewable = True
+            self._viewable[path] = viewable
+        return self._viewable[path]
+
+    def _root(self, tk: Any, path: str) -> str:
+        """Get the outermost hidden widget containing a hidden widget, in its window."""
+        if path not in self._roots:
+            parent = path.rsplit(".", 1)[0] or "."
+            if (
+                path == "."
+                or self.viewable(tk, parent)
+                or str(tk.call("winfo", "toplevel", path)) == path
+            ):
+                self._roots[path] = path
+            else:
+                self._roots[path] = self._root(tk, parent)
+        return self._roots[path]
+
+    def gate(self, tk: Any, path: str) -> Optional[Gate]:
+        """
+        Get the gate of a widget, if it isn't viewable.
+
+        :param tk: The Tcl interpreter of the widget
+        :type tk: Any
+        :param path: The path name of the widget
+        :type path: str
+        :return: The gate shared by the widgets hidden along with it, or None
+        :rtype: Optional[Gate]
+        """
+        if self.viewable(tk, path):
+            return None
+        root = self._root(tk, path)
+        if root not in self._gates:
+            self._gates[root] = VisibilityGate(
+                lambda: tk.getboolean(tk.call("winfo", "viewable", root))
+            )
+        return self._gates[root]
+
 
 class ElementDispatcher:
     """Efficient element handler dispatcher with pre-computed type mappings."""
@@ -63,6 +429,7 @@ class ElementDispatcher:
 
 class ElementReskinner:
     colorizer: Colorizer
+    plan: ReskinPlan
 
     def __init__(self, colorizer: Optional[Colorizer] = None):
         """
@@ -74,6 +441,8 @@ class ElementReskinner:
         self._titlebar_row_frame = "Not Set"
         self._dispatcher = ElementDispatcher()
         self._register_handlers()
+        if colorizer is not None:
+            self.update_colorizer(colorizer)
 
     def update_colorizer(self, colorizer: Colorizer):
         self.colorizer = colorizer
@@ -129,31 +498,49 @@ class ElementReskinner:
 
     def _handle_generic_tweaks(self, element: sg.Element) -> None:
         """Handle generic tweaks that apply to most elements."""
-        if (
-            getattr(element, "ParentRowFrame", False)
-            and element.metadata != sg.TITLEBAR_METADATA_MARKER
-        ):
-            self._parent_row_frame(element.ParentRowFrame, {"background": "BACKGROUND"})
+        # Row frames and backgrounds blend in with the neighbouring elements, so they
+        # animate along with them even when the element snaps.
+        with self._surface():
+            if (
+                getattr(element, "ParentRowFrame", False)
+                and element.metadata != sg.TITLEBAR_METADATA_MARKER
+            ):
+                self._parent_row_frame(
+                    element.ParentRowFrame, {"background": "BACKGROUND"}
+                )
 
-        if (
-            element.widget
-            and "background" in element.widget.keys()
-            and element.widget.cget("background")
-        ):
-            self.colorizer.element(element, {"background": "BACKGROUND"})
+            if (
+                element.widget
+                and "background" in element.widget.keys()
+                and element.widget.cget("background")
+            ):
+                self.plan.element(element, {"background": "BACKGROUND"})
 
     def _handle_right_click_menus(self, element: sg.Element) -> None:
         """Handle right-click menus."""
         # Thanks for pointing this out @dwelden!
         if element.TKRightClickMenu:
-            self._recurse_menu(element.TKRightClickMenu)
+            with self._detail():
+                self._recurse_menu(element.TKRightClickMenu, popup=True)
 
     def _handle_ttk_scrollbars(self, element: sg.Element) -> None:
         """Handle TTK scrollbars."""
+        with self._detail():
+            self._record_ttk_scrollbars(element)
+
+    def _record_ttk_scrollbars(self, element: sg.Element) -> None:
         if getattr(element, "vsb_style_name", False):
-            self._scrollbar(element.vsb_style_name, "Vertical.TScrollbar")
+            self._scrollbar(
+                element.vsb_style_name,
+                "Vertical.TScrollbar",
+                getattr(element, "vsb", None),
+            )
         if getattr(element, "hsb_style_name", False):
-            self._scrollbar(element.hsb_style_name, "Horizontal.TScrollbar")
+            self._scrollbar(
+                element.hsb_style_name,
+                "Horizontal.TScrollbar",
+                getattr(element, "hsb", None),
+            )
         if getattr(
             element, "ttk_style_name", False
         ) and element.ttk_style_name.endswith("TScrollbar"):
@@ -168,19 +555,211 @@ class ElementReskinner:
                 self._scrollbar(vertical_style, "TScrollbar")
             self._scrollbar(element.ttk_style_name, "TScrollbar")
 
+    def compile(
+        self,
+        elements: Iterable[sg.Element],
+        plan: ReskinPlan,
+        shared_styles: bool = False,
+        cull_hidden: bool = True,
+        level_of_detail: Union[bool, Callable[[sg.Element], bool]] = True,
+    ) -> ReskinPlan:
+        """
+        Record the operations needed to reskin the given elements into a plan.
+
+        This is where all the discovery work happens; the handlers inspect the elements
+        and their widgets once, and the resulting plan can then be replayed cheaply.
+
+        :param elements: The PySimpleGUI elements to reskin
+        :type elements: Iterable[sg.Element]
+        :param plan: The plan to record operations into
+        :type plan: ReskinPlan
+        :param shared_styles: If True, rebind ttk widgets whose styles are identical to
+            a single shared style, so that they're reskinned together
+        :type shared_styles: bool
+        :param cull_hidden: If True, defer updates of widgets that aren't viewable to
+            the final frame (or until they're shown)
+        :type cull_hidden: bool
+        :param level_of_detail: If True, snap menus, separators and sizegrips, as well
+            as the details of other elements (scrollbars, menus and table headings),
+            to the final frame. A function returning whether a given element
+            should snap may be passed instead, and False animates everything. Elements
+            whose metadata is a dict may override this with the "reskinner_lod" key
+            (either "animate" or "snap").
+        :type level_of_detail: Union[bool, Callable[[sg.Element], bool]]
+        :return: The plan
+        :rtype: ReskinPlan
+        """
+        for _ in self.compile_steps(
+            elements, plan, shared_styles, cull_hidden, level_of_detail
+        ):
+            pass
+        return plan
+
+    def compile_steps(
+        self,
+        elements: Iterable[sg.Element],
+        plan: ReskinPlan,
+        shared_styles: bool = False,
+        cull_hidden: bool = True,
+        level_of_detail: Union[bool, Callable[[sg.Element], bool]] = True,
+        budget: Optional[float] = None,
+    ) -> Iterator[None]:
+        """
+        Record the operations needed to reskin the given elements in time slices.
+
+        The plan is complete once the iterator is exhausted. The state of the
+        compilation is kept on this instance, so compilations that may be interleaved
+        need instances of their own. See ``compile()`` for the other arguments.
+
+        :param budget: The time budget of each slice, in milliseconds, or None to
+            compile everything in a single slice
+        :type budget: Optional[float]
+        :return: An iterator to advance once per slice
+        :rtype: Iterator[None]
+        """
+        self.plan = plan
+        self.shared_styles = shared_styles
+        # The shared style of each style signature found during this compilation.
+        self._shared: Dict[Tuple[Any, ...], str] = {}
+        # Paths of the menus already recorded, since menus may be shared by elements.
+        self._menus: Set[str] = set()
+        # The operations of the element being compiled that animate even if it snaps.
+        self._surfaces: Set[Operation] = set()
+        # How the element being compiled animates: "animate" (everything), "details"
+        # (everything but its details, which snap) or "snap" (nothing but its row
+        # frame and background).
+        self._lod = "animate"
+        visibility = _Visibility() if cull_hidden else None
+        deadline = None if budget is None else perf_counter() + budget / 1000
+        for element, operations in plan.segments:
+            if visibility is not None:
+                self._cull(visibility, element, operations)
+        for element in elements:
+            plan.begin_element(element)
+            self._lod = self._level_of_detail(element, level_of_detail)
+            self._surfaces.clear()
+            self._dispatcher.dispatch(element)
+            if self._lod == "snap":
+                for operation in plan.segments[-1][1]:
+                    if operation not in self._surfaces:
+                        operation.gate = _final_frame_only
+            if visibility is not None:
+                self._cull(visibility, element, plan.segments[-1][1])
+            if deadline is not None and perf_counter() >= deadline:
+                yield
+                deadline = perf_counter() + budget / 1000
+        plan.dedupe_styles()
+
+    @staticmethod
+    def _level_of_detail(
+        element: sg.Element,
+        level_of_detail: Union[bool, Callable[[sg.Element], bool]],
+    ) -> str:
+        """Get how an element animates; see ``compile()``."""
+        metadata = element.metadata
+        if isinstance(metadata, dict):
+            override = metadata.get(LEVEL_OF_DETAIL_METADATA_KEY)
+            if override in ("animate", "snap"):
+                return override
+        if level_of_detail is False:
+            return "animate"
+        if level_of_detail is True:
+            snap = isinstance(element, SNAPPING_ELEMENTS)
+        else:
+            snap = level_of_detail(element)
+        return "snap" if snap else "details"
+
+    @contextmanager
+    def _detail(self) -> Iterator[None]:
+        """Snaps the operations recorded within to the final frame, if details snap."""
+        operations = self.plan.segments[-1][1]
+        start = len(operations)
+        yield
+        if self._lod == "details":
+            for operation in operations[start:]:
+                operation.gate = _final_frame_only
+
+    @contextmanager
+    def _surface(self) -> Iterator[None]:
+        """Keeps the operations recorded within animating, even if the element snaps."""
+        operations = self.plan.segments[-1][1]
+        start = len(operations)
+        yield
+        self._surfaces.update(operations[start:])
+
+    @staticmethod
+    def _cull(
+        visibility: _Visibility,
+        element: Optional[sg.Element],
+        operations: List[Operation],
+    ) -> None:
+        """Gates the given operations on the viewability of the widgets they update."""
+        widget = getattr(element, "widget", None)
+        for operation in operations:
+            if operation.gate is not None:
+                continue
+            if isinstance(operation, WidgetOperation):
+                operation.gate = visibility.gate(operation.tk, operation.path)
+            elif isinstance(operation, TagOperation):
+                treeview = operation.treeview
+                operation.gate = visibility.gate(treeview.tk, str(treeview))
+            elif (
+                isinstance(operation, (StyleOperation, StyleMapOperation))
+                and operation.style not in _shared_styles
+                and isinstance(widget, TTKWidget)
+            ):
+                # PySimpleGUI gives each element its own styles.
+                operation.gate = visibility.gate(widget.tk, str(widget))
+
+    def _style(self, widget: TTKWidget, substyles: Tuple[str, ...] = ()) -> str:
+        """
+        Get the style to reskin a ttk widget through.
+
+        PySimpleGUI gives every ttk widget its own style. With shared styles enabled,
+        widgets whose styles (and the given sub-styles, such as ".Heading") are
+        identical are rebound to one shared style, e.g. "Reskinner3.TButton", so that
+        a single style update per frame recolors all of them.
+
+        :param widget: The ttk widget
+        :type widget: TTKWidget
+        :param substyles: Suffixes of the sub-styles to share along with the style
+        :type substyles: Tuple[str, ...]
+        :return: The name of the style to reskin
+        :rtype: str
+        """
+        style = str(widget.cget("style"))
+        if not self.shared_styles or not style or style in _shared_styles:
+            return style
+
+        styler = self.plan.styler
+        suffixes = ("", *substyles)
+        signature = (
+            _base_style(style),
+            *(_style_signature(styler, f"{style}{suffix}") for suffix in suffixes),
+        )
+        shared = self._shared.get(signature)
+        if shared is None:
+            shared = f"Reskinner{next(_shared_style_ids)}.{_base_style(style)}"
+            for suffix in suffixes:
+                _copy_style(styler, f"{style}{suffix}", f"{shared}{suffix}")
+            _shared_styles.add(shared)
+            self._shared[signature] = shared
+        widget.configure(style=shared)
+        return shared
+
     def reskin_element(self, element: sg.Element):
         """
-        Reskin an element.
+        Reskin an element with the current colorizer.
 
         :param element: The PySimpleGUI element to reskin
         :type element: sg.Element
         """
-        self._dispatcher.dispatch(element)
+        self.compile([element], ReskinPlan()).apply(self.colorizer)
 
     # Specific Elements
 
     def _reskin_custom_titlebar(self, element: sg.Element):
-        self.colorizer.element(element, {"background": ("BUTTON", 1)})
+        self.plan.element(element, {"background": ("BUTTON", 1)})
         if element.ParentRowFrame:
             self._parent_row_frame(
                 element.ParentRowFrame, {"background": ("BUTTON", 1)}
@@ -189,14 +768,14 @@ class ElementReskinner:
 
     def _reskin_titlebar_child(self, element: sg.Element):
         self._parent_row_frame(element.ParentRowFrame, {"background": ("BUTTON", 1)})
-        self.colorizer.element(element, {"background": ("BUTTON", 1)})
+        self.plan.element(element, {"background": ("BUTTON", 1)})
         if "foreground" in element.widget.keys():
-            self.colorizer.element(element, {"foreground": ("BUTTON", 0)})
+            self.plan.element(element, {"foreground": ("BUTTON", 0)})
 
     def _reskin_button(self, element: sg.Button):
         if issubclass(element.widget.__class__, TTKWidget):  # For Ttk Buttons.
-            style = element.widget.cget("style")
-            self.colorizer.style(
+            style = self._style(element.widget)
+            self.plan.style(
                 style,
                 {
                     "background": ("BUTTON", 1),
@@ -204,7 +783,7 @@ class ElementReskinner:
                 },
                 "TButton",
             )
-            self.colorizer.map(
+            self.plan.map(
                 style,
                 {
                     "background": {
@@ -219,7 +798,7 @@ class ElementReskinner:
                 "TButton",
             )
         else:  # For regular buttons.
-            self.colorizer.element(
+            self.plan.element(
                 element,
                 {
                     "background": ("BUTTON", 1),
@@ -230,7 +809,7 @@ class ElementReskinner:
             )
 
     def _reskin_buttonmenu(self, element: sg.ButtonMenu):
-        self.colorizer.element(
+        self.plan.element(
             element,
             {
                 "background": ("BUTTON", 1),
@@ -240,10 +819,11 @@ class ElementReskinner:
             },
         )
         if getattr(element, "TKMenu", False):
-            self._recurse_menu(element.TKMenu)
+            with self._detail():
+                self._recurse_menu(element.TKMenu, popup=True)
 
     def _reskin_canvas(self, element: sg.Canvas):
-        self.colorizer.element(element, {"highlightbackground": "BACKGROUND"})
+        self.plan.element(element, {"highlightbackground": "BACKGROUND"})
 
     def _reskin_column(self, element: sg.Column):
         # Handle hidden columns.
@@ -251,9 +831,9 @@ class ElementReskinner:
             return
 
         def _configure_child(child: Union[TKFrame, TKCanvas]):
-            self.colorizer.configure(
+            self.plan.widget(
+                child,
                 {"background": "BACKGROUND", "highlightbackground": "BACKGROUND"},
-                child.configure,
                 child.cget,
             )
 
@@ -267,31 +847,38 @@ class ElementReskinner:
                 _configure_child(child.children["!frame"])
 
     def _reskin_combo(self, element: sg.Combo):
-        # Configuring the listbox (popdown) of the combo.
-        element.widget.tk.call(
-            "eval", f"set popdown [ttk::combobox::PopdownWindow {element.widget}]"
-        )
-
-        def _configure_combo_popdown(**kwargs):
-            for attribute, value in kwargs.items():
-                element.widget.tk.call(
-                    "eval", f"$popdown.f.l configure -{attribute} {value}"
-                )
-
-        self.colorizer.configure(
-            {
-                "background": "INPUT",
-                "foreground": "TEXT_INPUT",
-                "selectforeground": "INPUT",
-                "selectbackground": "TEXT_INPUT",
-            },
-            _configure_combo_popdown,
-            _default_combo_popdown_cget,
-        )
+        # Configuring the listbox (popdown) of the combo. Popdowns are only updated on
+        # intermediate frames while they're open, and those that were never opened are
+        # configured when they first are.
+        popdown_configuration = {
+            "background": "INPUT",
+            "foreground": "TEXT_INPUT",
+            "selectforeground": "INPUT",
+            "selectbackground": "TEXT_INPUT",
+        }
+        popdown = _combo_popdown(element)
+        if popdown is None:
+            self.plan.configure(
+                popdown_configuration,
+                _configure_popdown_on_post(element),
+                _default_combo_popdown_cget,
+                _final_frame_only,
+            )
+        else:
+            if element in _combo_postcommands:
+                element.widget.configure(postcommand=_combo_postcommands.pop(element))
+            tk = element.widget.tk
+            self.plan.path(
+                tk,
+                f"{popdown}.f.l",
+                popdown_configuration,
+                _default_combo_popdown_cget,
+                lambda: tk.getboolean(tk.call("winfo", "ismapped", popdown)),
+            )
 
         # Configuring the combo itself.
-        style_name = element.widget["style"]
-        self.colorizer.style(
+        style_name = self._style(element.widget)
+        self.plan.style(
             style_name,
             {
                 "selectforeground": "TEXT_INPUT",
@@ -303,7 +890,7 @@ class ElementReskinner:
             },
             _default_element_cget(sg.Combo, "style"),
         )
-        self.colorizer.map(
+        self.plan.map(
             style_name,
             {
                 "foreground": {"readonly": "TEXT_INPUT"},
@@ -314,10 +901,10 @@ class ElementReskinner:
         )
 
     def _reskin_frame(self, element: sg.Frame):
-        self.colorizer.element(element, {"foreground": "TEXT"})
+        self.plan.element(element, {"foreground": "TEXT"})
 
     def _reskin_listbox(self, element: sg.Listbox):
-        self.colorizer.element(
+        self.plan.element(
             element,
             {
                 "foreground": "TEXT_INPUT",
@@ -331,39 +918,38 @@ class ElementReskinner:
         self._recurse_menu(element.widget)
 
     def _reskin_progressbar(self, element: sg.ProgressBar):
-        style_name = element.ttk_style_name
-        self.colorizer.style(
+        style_name = self._style(element.widget)
+        self.plan.style(
             style_name,
             {"background": ("PROGRESS", 0), "troughcolor": ("PROGRESS", 1)},
             _default_element_cget(sg.ProgressBar, "style"),
         )
 
     def _reskin_optionmenu(self, element: sg.OptionMenu):
-        self._optionmenu_menu(
-            element,
-            {
-                "foreground": "TEXT_INPUT",
-                "background": "INPUT",
-            },
-        )
-        if ALTER_MENU_ACTIVE_COLORS:
+        with self._detail():
             self._optionmenu_menu(
                 element,
-                {"activeforeground": "INPUT", "activebackground": "TEXT_INPUT"},
+                {
+                    "foreground": "TEXT_INPUT",
+                    "background": "INPUT",
+                },
             )
-        self.colorizer.element(
-            element, {"foreground": "TEXT_INPUT", "background": "INPUT"}
-        )
+            if ALTER_MENU_ACTIVE_COLORS:
+                self._optionmenu_menu(
+                    element,
+                    {"activeforeground": "INPUT", "activebackground": "TEXT_INPUT"},
+                )
+        self.plan.element(element, {"foreground": "TEXT_INPUT", "background": "INPUT"})
 
     def _reskin_sizegrip(self, element: sg.Sizegrip):
         sizegrip_style = element.widget.cget("style")
-        self.colorizer.style(sizegrip_style, {"background": "BACKGROUND"}, "TSizegrip")
+        self.plan.style(sizegrip_style, {"background": "BACKGROUND"}, "TSizegrip")
 
     def _reskin_slider(self, element: sg.Slider):
-        self.colorizer.element(element, {"foreground": "TEXT", "troughcolor": "SCROLL"})
+        self.plan.element(element, {"foreground": "TEXT", "troughcolor": "SCROLL"})
 
     def _reskin_spin(self, element: sg.Spin):
-        self.colorizer.element(
+        self.plan.element(
             element,
             {
                 "background": "INPUT",
@@ -373,14 +959,14 @@ class ElementReskinner:
         )
 
     def _reskin_tabgroup(self, element: sg.TabGroup):
-        style_name = element.widget.cget("style")
-        self.colorizer.style(style_name, {"background": "BACKGROUND"}, "TNotebook")
-        self.colorizer.style(
+        style_name = self._style(element.widget, (".Tab",))
+        self.plan.style(style_name, {"background": "BACKGROUND"}, "TNotebook")
+        self.plan.style(
             f"{style_name}.Tab",
             {"background": "INPUT", "foreground": "TEXT_INPUT"},
             "TNotebook.Tab",
         )
-        self.colorizer.map(
+        self.plan.map(
             f"{style_name}.Tab",
             {
                 "foreground": {"pressed": ("BUTTON", 1), "selected": "TEXT"},
@@ -392,22 +978,12 @@ class ElementReskinner:
 
     def _reskin_checkbox(self, element: Union[sg.Checkbox, sg.Radio]):
         element_type = type(element)
-        toggle = (
-            _get_checkbox_radio_selectcolor(
-                self.colorizer.theme_color(
-                    "BACKGROUND",
-                    lambda: _default_element_cget(element_type, "selectcolor"),
-                ),
-                self.colorizer.theme_color(
-                    "TEXT",
-                    lambda: _default_element_cget(element_type, "selectcolor"),
-                ),
-            ),
+        self.plan.widget(
+            element.widget,
+            {"selectcolor": CHECKBOX_SELECTCOLOR},
+            lambda attribute: _default_element_cget(element_type, attribute),
         )
-        element.widget.configure(
-            {"selectcolor": toggle}
-        )  # A rare case where we use the configure method directly.
-        self.colorizer.element(
+        self.plan.element(
             element,
             {
                 "background": "BACKGROUND",
@@ -420,11 +996,11 @@ class ElementReskinner:
     def _reskin_separator(
         self, element: Union[sg.HorizontalSeparator, sg.VerticalSeparator]
     ):
-        style_name = element.widget.cget("style")
-        self.colorizer.style(style_name, {"background": "BACKGROUND"}, "TSeparator")
+        style_name = self._style(element.widget)
+        self.plan.style(style_name, {"background": "BACKGROUND"}, "TSeparator")
 
     def _reskin_input(self, element: Union[sg.Input, sg.Multiline]):
-        self.colorizer.element(
+        self.plan.element(
             element,
             {
                 "foreground": "TEXT_INPUT",
@@ -436,7 +1012,7 @@ class ElementReskinner:
         )
 
     def _reskin_text(self, element: Union[sg.Text, sg.StatusBar]):
-        self.colorizer.element(
+        self.plan.element(
             element,
             {
                 "background": "BACKGROUND",
@@ -445,13 +1021,13 @@ class ElementReskinner:
         )
 
     def _reskin_table(self, element: Union[sg.Table, sg.Tree]):
-        style_name = element.widget["style"]
+        style_name = self._style(element.widget, (".Heading",))
         default_style = element.widget.winfo_class()
 
         def _default_color(attribute: str) -> str:
-            return self.colorizer.styler.lookup(default_style, attribute)
+            return self.plan.styler.lookup(default_style, attribute)
 
-        self.colorizer.style(
+        self.plan.style(
             style_name,
             {
                 "foreground": "TEXT",
@@ -462,7 +1038,7 @@ class ElementReskinner:
             default_style,
             fallback="white",
         )
-        self.colorizer.map(
+        self.plan.map(
             style_name,
             {
                 "foreground": {
@@ -476,17 +1052,16 @@ class ElementReskinner:
             True,
             fallback="white",
         )
-        self.colorizer.style(
-            f"{style_name}.Heading",
-            {
-                "foreground": "TEXT_INPUT",
-                "background": "INPUT",
-            },
-            f"{default_style}.Heading",
-        )
-
-        if isinstance(element, sg.Table):
-            self.colorizer.map(
+        with self._detail():
+            self.plan.style(
+                f"{style_name}.Heading",
+                {
+                    "foreground": "TEXT_INPUT",
+                    "background": "INPUT",
+                },
+                f"{default_style}.Heading",
+            )
+            self.plan.map(
                 f"{style_name}.Heading",
                 {
                     "foreground": {"active": "INPUT"},
@@ -496,42 +1071,42 @@ class ElementReskinner:
                 True,
             )
 
-            if (not element.tree_ids) or (not element.TKTreeview):
-                return
-
-            for row_id in element.tree_ids:
-                self.colorizer.configure(
-                    {"background": "BACKGROUND", "foreground": "TEXT"},
-                    partial(element.TKTreeview.tag_configure, row_id),
-                    _default_color,
-                )
-
-            # These have to be set for future elements added post-reskin
-            element.BackgroundColor = self.colorizer.theme_color(
-                "BACKGROUND", lambda: _default_color("BACKGROUND")
-            )
-            element.TextColor = self.colorizer.theme_color(
-                "TEXT", lambda: _default_color("TEXT")
-            )
-            element.HeaderBackgroundColor = self.colorizer.theme_color(
-                "INPUT", lambda: _default_color("INPUT")
-            )
-            element.HeaderTextColor = self.colorizer.theme_color(
-                "TEXT_INPUT", lambda: _default_color("TEXT_INPUT")
-            )
+        # Rows get their colors from the style, which is reskinned above; only a
+        # bounded number of tags need to be handled, whatever the number of rows.
+        if element.TKTreeview:
+            if isinstance(element, sg.Table):
+                if element.tree_ids:
+                    _release_row_tags(element)
+            else:
+                for tag, configuration in _themed_tags(element).items():
+                    self.plan.tag(
+                        element.TKTreeview, tag, configuration, _default_color
+                    )
+
+        # These have to be set for rows added post-reskin
+        self.plan.attributes(
+            element,
+            {
+                "BackgroundColor": "BACKGROUND",
+                "TextColor": "TEXT",
+                "HeaderBackgroundColor": "INPUT",
+                "HeaderTextColor": "TEXT_INPUT",
+            },
+            _default_color,
+        )
 
     def _parent_row_frame(
         self,
         parent_row_frame: TKFrame,
         configuration: ThemeConfiguration,
     ):
-        self.colorizer.configure(
+        self.plan.widget(
+            parent_row_frame,
             configuration,
-            parent_row_frame.configure,
             getattr(DEFAULT_ELEMENTS[sg.Text], "ParentRowFrame").cget,
         )
 
-    def _recurse_menu(self, tkmenu):
+    def _recurse_menu(self, tkmenu, popup: bool = False):
         """
         Internal use only.
 
@@ -540,49 +1115,59 @@ class ElementReskinner:
         on. Rather, we recursively find and reconfigure the individual Menu objects that make up menus and
         submenus.
 
+        Menus are recorded once per plan, however many elements share them. Popup menus
+        and submenus are only shown while posted, so their entries are only updated on
+        intermediate frames while they are.
+
         :param tkmenu: The Tkinter menu object.
+        :param popup: Whether the menu is a popup (rather than a menubar).
         :return: None
         """
-        end_menu_index = tkmenu.index("end")
-
-        # This fixes issue #8. Thank you, @richnanney for reporting!
-        if end_menu_index is None:
+        if str(tkmenu) in self._menus:
             return
+        self._menus.add(str(tkmenu))
 
-        for index in range(0, end_menu_index + 1):
+        # An empty schema fixes issue #8. Thank you, @richnanney for reporting!
+        gate = _menu_posted(tkmenu) if popup else None
+        for index, options in _menu_schema(tkmenu):
             self._menu_entry(
                 tkmenu,
                 index,
+                options,
                 {
                     "foreground": "TEXT_INPUT",
                     "background": "INPUT",
                     "activeforeground": "INPUT",
                     "activebackground": "TEXT_INPUT",
                 },
+                gate,
             )
 
         for child in tkmenu.children.values():
             if issubclass(type(child), TKMenu):
-                self._recurse_menu(child)
+                self._recurse_menu(child, popup=True)
 
     def _menu_entry(
         self,
         menu: TKMenu,
         index: int,
+        options: FrozenSet[str],
         configuration: ThemeConfiguration,
+        gate: Optional[Callable[[], bool]] = None,
     ):
-        configuration = dict(
-            filter(
-                lambda item: item[0] in menu.entryconfigure(index).keys(),
-                configuration.items(),
-            )
-        )
+        configuration = {
+            attribute: key
+            for attribute, key in configuration.items()
+            if attribute in options
+        }
         # Filter the configs for menu entries that don't accept the full config dict. Fixes issue #11.
         # Brought back in v4.0.2 after its omission caused a regression leading to issue #22.
-        self.colorizer.configure(
+        self.plan.menu_entry(
+            menu,
+            index,
             configuration,
-            lambda **_configurations: menu.entryconfigure(index, _configurations),
             lambda attribute: _default_element_cget(sg.Menu, attribute),
+            gate,
         )
 
     def _optionmenu_menu(
@@ -590,9 +1175,9 @@ class ElementReskinner:
         optionmenu: sg.OptionMenu,
         configuration: ThemeConfiguration,
     ):
-        self.colorizer.configure(
+        self.plan.widget(
+            optionmenu.widget["menu"],
             configuration,
-            optionmenu.widget["menu"].configure,
             lambda attribute: _default_element_cget(sg.Menu, attribute),
         )
 
@@ -600,8 +1185,11 @@ class ElementReskinner:
         self,
         style_name: str,
         default_style: str,
+        widget: Optional[TTKWidget] = None,
     ):
-        self.colorizer.style(
+        if widget is not None:
+            style_name = self._style(widget)
+        self.plan.style(
             style_name,
             {
                 "troughcolor": ScrollbarColorKey.TROUGH.value,
@@ -610,7 +1198,7 @@ class ElementReskinner:
             },
             default_style,
         )
-        self.colorizer.map(
+        self.plan.map(
             style_name,
             {
                 "background": {
@@ -1,8 +1,7 @@
-from typing import Dict
+from typing import Tuple
 
-from colour import Color
-
-from ._compat import Protocol
+from ._compat import Literal, Protocol
+from .color import RGBColor
 
 
 def _clamp(v: float):
@@ -14,7 +13,7 @@ class InterpolationFormula(Protocol):
 
 
 class InterpolationMethod(Protocol):
-    def __call__(self, start: Color, end: Color, progress: float) -> Color: ...
+    def __call__(self, start: RGBColor, end: RGBColor, progress: float) -> RGBColor: ...
 
 
 def _lerp(start: float, end: float, progress: float) -> float:
@@ -33,65 +32,41 @@ def _hue_swap(start: float, end: float, progress: float) -> float:
 
 
 def _interpolate(
-    start: Color,
-    end: Color,
+    start: RGBColor,
+    end: RGBColor,
     progress: float,
-    components_and_methods: Dict[str, InterpolationFormula],
-) -> Color:
+    formulas: Tuple[InterpolationFormula, InterpolationFormula, InterpolationFormula],
+    space: Literal["rgb", "hsl"],
+) -> RGBColor:
     if progress == 1:
         return end
     elif progress == 0:
         return start
-    values = {
-        component: _clamp(
-            method(
-                getattr(start, component),
-                getattr(end, component),
-                progress,
-            )
+    first, second, third = formulas
+    if space == "rgb":
+        return RGBColor(
+            _clamp(first(start.red, end.red, progress)),
+            _clamp(second(start.green, end.green, progress)),
+            _clamp(third(start.blue, end.blue, progress)),
         )
-        for component, method in components_and_methods.items()
-    }
-    return Color(**values)
-
-
-def rgb(start: Color, end: Color, progress: float) -> Color:
-    return _interpolate(
-        start,
-        end,
-        progress,
-        {
-            "red": _lerp,
-            "green": _lerp,
-            "blue": _lerp,
-        },
+    start_hsl, end_hsl = start.hsl, end.hsl
+    return RGBColor.from_hsl(
+        _clamp(first(start_hsl[0], end_hsl[0], progress)),
+        _clamp(second(start_hsl[1], end_hsl[1], progress)),
+        _clamp(third(start_hsl[2], end_hsl[2], progress)),
     )
 
 
-def hue(start: Color, end: Color, progress: float) -> Color:
-    return _interpolate(
-        start,
-        end,
-        progress,
-        {
-            "hue": _lerp,
-            "saturation": _lerp,
-            "luminance": _lerp,
-        },
-    )
+def rgb(start: RGBColor, end: RGBColor, progress: float) -> RGBColor:
+    return _interpolate(start, end, progress, (_lerp, _lerp, _lerp), "rgb")
 
 
-def hsl(start: Color, end: Color, progress: float) -> Color:
-    return _interpolate(
-        start,
-        end,
-        progress,
-        {
-            "hue": _hue_swap,
-            "saturation": _lerp,
-            "luminance": _lerp,
-        },
-    )
+def hue(start: RGBColor, end: RGBColor, progress: float) -> RGBColor:
+    return _interpolate(start, end, progress, (_lerp, _lerp, _lerp), "hsl")
+
+
+def hsl(start: RGBColor, end: RGBColor, progress: float) -> RGBColor:
+    return _interpolate(start, end, progress, (_hue_swap, _lerp, _lerp), "hsl")
 
 
 INTERPOLATION_MODES = {
@@ -0,0 +1,777 @@
+import re
+from copy import copy
+from functools import partial
+from time import perf_counter
+from tkinter import Menu as TKMenu
+from tkinter import Misc
+from tkinter.ttk import Style
+from tkinter.ttk import Treeview as TTKTreeview
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .colorizer import (
+    Colorizer,
+    ThemeConfiguration,
+    ThemeDictColorKey,
+    _default_element_cget,
+    _default_window_cget,
+)
+from .sg import sg
+
+# A single attribute bound to a theme color key, along with the function supplying
+# its default color (used when the theme value isn't a valid color).
+Binding = Tuple[Any, ThemeDictColorKey, Callable[[], str]]
+
+# Type alias for callbacks run around each element's operations
+ElementCallback = Callable[[sg.Element, Colorizer], None]
+
+# Type alias for functions telling whether an operation's target is showing
+Gate = Callable[[], bool]
+
+
+class VisibilityGate:
+    """
+    A gate telling whether a widget that wasn't viewable has since been shown.
+
+    Other gates (e.g. those of posted menus, or deferring details to the final frame)
+    hold back operations whatever is showing, and don't make an element hidden.
+    """
+
+    __slots__ = ("viewable",)
+
+    def __init__(self, viewable: Gate):
+        self.viewable = viewable
+
+    def __call__(self) -> bool:
+        return self.viewable()
+
+
+def _bind(
+    configuration: ThemeConfiguration,
+    default_color_function: Callable[[str], str],
+) -> List[Binding]:
+    return [
+        (attribute, key, partial(default_color_function, attribute))
+        for attribute, key in configuration.items()
+    ]
+
+
+def _any_open(gates: Tuple[Gate, ...]) -> Gate:
+    """Combines gates into one that's open whenever any of them is."""
+
+    def any_open() -> bool:
+        return any(gate() for gate in gates)
+
+    if any(isinstance(gate, VisibilityGate) for gate in gates):
+        return VisibilityGate(any_open)
+    return any_open
+
+
+def _options(values: Dict[str, str]) -> List[str]:
+    """Flatten a dict of configurations into Tcl option/value arguments."""
+    options = []
+    for attribute, value in values.items():
+        options.append(f"-{attribute}")
+        options.append(value)
+    return options
+
+
+_TCL_SPECIAL_CHARACTERS = re.compile(r'[\\\[\]{}"$;\s]')
+_TCL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+def _tcl_quote(word: Any) -> str:
+    """Quote a value so that it is parsed as a single word in a Tcl script."""
+    word = str(word)
+    if not word:
+        return "{}"
+    return _TCL_SPECIAL_CHARACTERS.sub(
+        lambda match: _TCL_ESCAPES.get(match.group(), "\\" + match.group()), word
+    )
+
+
+def _tcl_command(words: List[Any]) -> str:
+    return " ".join(map(_tcl_quote, words))
+
+
+class Operation:
+    """
+    A single, pre-discovered color update.
+
+    Operations are produced once, while compiling a plan, and replayed on every frame
+    of a transition with the colors of the current palette.
+    """
+
+    __slots__ = ("bindings", "target", "gate")
+
+    # Whether the operation can be run with only some of its bindings' values. Those
+    # that can't (such as style maps, which replace every state of an option at once)
+    # are run in full whenever any of their values change.
+    partial = True
+
+    def __init__(
+        self, bindings: List[Binding], target: Hashable, gate: Optional[Gate] = None
+    ):
+        self.bindings: Tuple[Binding, ...] = tuple(bindings)
+        # Identifies what the operation configures, for tracking applied values.
+        self.target = target
+        # Tells whether the target is currently showing; operations whose targets
+        # aren't are deferred to the final frame. Gates are checked once per frame.
+        self.gate = gate
+
+    def values(self, colorizer: Colorizer) -> Dict[Any, str]:
+        """Resolve the colors of this operation's bindings from the current palette."""
+        return {
+            attribute: colorizer.theme_color(key, default)
+            for attribute, key, default in self.bindings
+        }
+
+    def apply(self, colorizer: Colorizer) -> None:
+        self.run(self.values(colorizer))
+
+    def restrict(self, keys: Collection[ThemeDictColorKey]) -> "Operation":
+        """
+        Get a version of this operation with only the bindings to the given keys.
+
+        :param keys: The theme color keys to keep bindings of
+        :type keys: Collection[ThemeDictColorKey]
+        :return: The restricted operation (this one, if nothing was left out)
+        :rtype: Operation
+        """
+        if not self.partial:
+            return self
+        bindings = tuple(binding for binding in self.bindings if binding[1] in keys)
+        if len(bindings) == len(self.bindings):
+            return self
+        restricted = copy(self)
+        restricted.bindings = bindings
+        return restricted
+
+    def run(self, values: Dict[Any, str]) -> None:
+        raise NotImplementedError
+
+    def command(self, values: Dict[Any, str]) -> Optional[List[Any]]:
+        """
+        Get the words of the Tcl command equivalent to running this operation.
+
+        :return: The words of the command, or None if the operation can't be expressed
+            in Tcl (and must be run directly instead)
+        :rtype: Optional[List[Any]]
+        """
+        return None
+
+
+class WidgetOperation(Operation):
+    """Configures a Tk widget (or anything else with a ``configure`` subcommand)."""
+
+    __slots__ = ("tk", "path")
+
+    def __init__(
+        self, tk: Any, path: str, bindings: List[Binding], gate: Optional[Gate] = None
+    ):
+        super().__init__(bindings, path, gate)
+        self.tk = tk
+        self.path = path
+
+    def run(self, values: Dict[Any, str]) -> None:
+        self.tk.call(self.path, "configure", *_options(values))
+
+    def command(self, values: Dict[Any, str]) -> Optional[List[Any]]:
+        return [self.path, "configure", *_options(values)]
+
+
+class StyleOperation(Operation):
+    """Configures a ttk style."""
+
+    __slots__ = ("styler", "style")
+
+    def __init__(self, styler: Style, style: str, bindings: List[Binding]):
+        super().__init__(bindings, ("configure", style))
+        self.styler = styler
+        self.style = style
+
+    def run(self, values: Dict[Any, str]) -> None:
+        self.styler.configure(self.style, **values)
+
+    def command(self, values: Dict[Any, str]) -> Optional[List[Any]]:
+        return ["ttk::style", "configure", self.style, *_options(values)]
+
+
+class StyleMapOperation(Operation):
+    """Sets the dynamic (state-dependent) values of a ttk style."""
+
+    __slots__ = ("styler", "style")
+
+    partial = False
+
+    def __init__(self, styler: Style, style: str, bindings: List[Binding]):
+        # Bindings of map operations are keyed by (option, state) pairs.
+        super().__init__(bindings, ("map", style))
+        self.styler = styler
+        self.style = style
+
+    @staticmethod
+    def _mapping(values: Dict[Any, str]) -> Dict[str, List[Tuple[str, str]]]:
+        mapping: Dict[str, List[Tuple[str, str]]] = {}
+        for (option, state), value in values.items():
+            mapping.setdefault(option, []).append((state, value))
+        return mapping
+
+    def run(self, values: Dict[Any, str]) -> None:
+        self.styler.map(self.style, **self._mapping(values))
+
+    def command(self, values: Dict[Any, str]) -> Optional[List[Any]]:
+        return [
+            "ttk::style",
+            "map",
+            self.style,
+            *_options(
+                {
+                    option: _tcl_command([word for pair in pairs for word in pair])
+                    for option, pairs in self._mapping(values).items()
+                }
+            ),
+        ]
+
+
+class MenuEntryOperation(Operation):
+    """Configures a single entry of a Tk menu."""
+
+    __slots__ = ("menu", "index")
+
+    def __init__(
+        self,
+        menu: TKMenu,
+        index: int,
+        bindings: List[Binding],
+        gate: Optional[Gate] = None,
+    ):
+        super().__init__(bindings, (str(menu), index), gate)
+        self.menu = menu
+        self.index = index
+
+    def run(self, values: Dict[Any, str]) -> None:
+        self.menu.entryconfigure(self.index, values)
+
+    def command(self, values: Dict[Any, str]) -> Optional[List[Any]]:
+        return [str(self.menu), "entryconfigure", self.index, *_options(values)]
+
+
+class TagOperation(Operation):
+    """Configures a ttk Treeview tag."""
+
+    __slots__ = ("treeview", "tag")
+
+    def __init__(self, treeview: TTKTreeview, tag: Any, bindings: List[Binding]):
+        super().__init__(bindings, (str(treeview), "tag", str(tag)))
+        self.treeview = treeview
+        self.tag = tag
+
+    def run(self, values: Dict[Any, str]) -> None:
+        self.treeview.tag_configure(self.tag, **values)
+
+    def command(self, values: Dict[Any, str]) -> Optional[List[Any]]:
+        return [str(self.treeview), "tag", "configure", self.tag, *_options(values)]
+
+
+class AttributeOperation(Operation):
+    """Sets Python attributes (e.g. the color attributes of an element)."""
+
+    __slots__ = ("object",)
+
+    def __init__(self, target: Any, bindings: List[Binding]):
+        super().__init__(bindings, id(target))
+        self.object = target
+
+    def run(self, values: Dict[Any, str]) -> None:
+        for attribute, value in values.items():
+            setattr(self.object, attribute, value)
+
+
+class CallbackOperation(Operation):
+    """Passes the resolved colors to an arbitrary function, as keyword arguments."""
+
+    __slots__ = ("function",)
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        bindings: List[Binding],
+        gate: Optional[Gate] = None,
+    ):
+        super().__init__(bindings, id(function), gate)
+        self.function = function
+
+    def run(self, values: Dict[Any, str]) -> None:
+        self.function(**values)
+
+
+class ReskinPlan:
+    """
+    A flat list of the operations needed to reskin a window.
+
+    Compiling a plan does all the discovery work (walking the elements, dispatching
+    them to their handlers and probing their widgets) once. Each frame of a transition
+    then only replays the operations with the colors of the current palette.
+
+    The builder methods mirror those of ``Colorizer``, but record operations instead of
+    applying them.
+    """
+
+    def __init__(
+        self,
+        styler: Optional[Style] = None,
+        applied: Optional[Dict[Tuple[Hashable, Any], str]] = None,
+    ):
+        self.styler: Style = styler or Style()
+        self.operations: List[Operation] = []
+        # Reverse index of the operations bound to each theme color key.
+        self.index: Dict[ThemeDictColorKey, List[Operation]] = {}
+        # The last value applied to each (target, attribute), so that values which
+        # didn't change since they were last applied are never re-sent to Tk.
+        self.applied: Dict[Tuple[Hashable, Any], str] = (
+            {} if applied is None else applied
+        )
+        self.skipped_calls: int = 0
+        self.skipped_values: int = 0
+        # The operations grouped by the element that produced them; the first group
+        # holds window-level operations.
+        self.segments: List[Tuple[Optional[sg.Element], List[Operation]]] = [(None, [])]
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def add(self, operation: Operation) -> None:
+        self.operations.append(operation)
+        self.segments[-1][1].append(operation)
+        for key in dict.fromkeys(key for _, key, _ in operation.bindings):
+            self.index.setdefault(key, []).append(operation)
+
+    def select(self, keys: Collection[ThemeDictColorKey]) -> "ReskinPlan":
+        """
+        Derives a plan restricted to the bindings of the given theme color keys.
+
+        Reskinning between themes that share most of their values then only costs as
+        much as the number of bindings to keys that actually change, e.g.
+        ``plan.select(colorizer.changed_keys)``. Every element is kept (so element
+        callbacks still run for each of them), and the derived plan shares this one's
+        record of applied values.
+
+        :param keys: The theme color keys to keep bindings of
+        :type keys: Collection[ThemeDictColorKey]
+        :return: The derived plan
+        :rtype: ReskinPlan
+        """
+        affected = {operation for key in keys for operation in self.index.get(key, ())}
+        selection = ReskinPlan(self.styler, self.applied)
+        for element, operations in self.segments:
+            if element is not None:
+                selection.begin_element(element)
+            for operation in operations:
+                if operation in affected:
+                    selection.add(operation.restrict(keys))
+        return selection
+
+    def begin_element(self, element: sg.Element) -> None:
+        """Groups the operations added henceforth under the given element."""
+        self.segments.append((element, []))
+
+    def dedupe_styles(self) -> None:
+        """
+        Drops the ttk style operations that repeat an earlier one.
+
+        ttk styles are global to the Tk interpreter, so the widgets sharing a style
+        (including those of different windows) would otherwise each update it on every
+        frame. The operation that's kept is gated open whenever any of its duplicates'
+        targets are showing.
+        """
+        kept: Dict[Tuple[Hashable, ...], Operation] = {}
+        gates: Dict[Operation, Dict[Optional[Gate], None]] = {}
+        dropped: Set[Operation] = set()
+        for operation in self.operations:
+            if not isinstance(operation, (StyleOperation, StyleMapOperation)):
+                continue
+            signature = (
+                operation.target,
+                *((attribute, key) for attribute, key, _ in operation.bindings),
+            )
+            original = kept.setdefault(signature, operation)
+            gates.setdefault(original, {})[operation.gate] = None
+            if original is not operation:
+                dropped.add(operation)
+        if not dropped:
+            return
+
+        for operation, operation_gates in gates.items():
+            if None in operation_gates:
+                operation.gate = None
+            elif len(operation_gates) > 1:
+                operation.gate = _any_open(tuple(filter(None, operation_gates)))
+        self.operations = [
+            operation for operation in self.operations if operation not in dropped
+        ]
+        self.segments = [
+            (
+                element,
+                [operation for operation in operations if operation not in dropped],
+            )
+            for element, operations in self.segments
+        ]
+        self.index = {
+            key: [operation for operation in operations if operation not in dropped]
+            for key, operations in self.index.items()
+        }
+
+    def apply(
+        self,
+        colorizer: Colorizer,
+        before_element: Optional[ElementCallback] = None,
+        after_element: Optional[ElementCallback] = None,
+        batch: bool = False,
+    ) -> None:
+        """
+        Replays the plan with the colors of the colorizer's current palette.
+
+        :param colorizer: The colorizer supplying the colors of the current frame
+        :type colorizer: Colorizer
+        :param before_element: Optional callback before each element is reskinned
+        :param after_element: Optional callback after each element is reskinned
+        :param batch: If True, collect the frame's Tk updates into a single Tcl script
+            evaluated in one go, instead of making a Tcl call per operation
+        :type batch: bool
+        """
+        run = self._batched if batch else self._direct
+        # Gates are only checked (once each) on intermediate frames.
+        gates: Optional[Dict[Gate, bool]] = None if colorizer.progress >= 1 else {}
+        if before_element is None and after_element is None:
+            run(self._open(self.operations, gates), colorizer)
+            return
+
+        for element, operations in self.segments:
+            if element is not None and before_element:
+                before_element(element, colorizer)
+            run(self._open(operations, gates), colorizer)
+            if element is not None and after_element:
+                after_element(element, colorizer)
+
+    def steps(
+        self,
+        colorizer: Colorizer,
+        budget: float,
+        before_element: Optional[ElementCallback] = None,
+        after_element: Optional[ElementCallback] = None,
+        batch: bool = False,
+        focus: Optional[sg.Element] = None,
+    ) -> Iterator[None]:
+        """
+        Replays the plan in time slices, yielding whenever a slice's budget runs out.
+
+        Window-level operations and the focused element go first, followed by the
+        elements whose widgets are viewable (those with no operations gated on their
+        visibility), and then the rest, so that the new colors show up where the user
+        is looking first.
+
+        :param colorizer: The colorizer supplying the colors of the current frame
+        :type colorizer: Colorizer
+        :param budget: The time budget of each slice, in milliseconds
+        :type budget: float
+        :param before_element: Optional callback before each element is reskinned
+        :param after_element: Optional callback after each element is reskinned
+        :param batch: If True, collect each element's Tk updates into a Tcl script
+        :type batch: bool
+        :param focus: The element to reskin before the others
+        :type focus: Optional[sg.Element]
+        :return: An iterator to advance once per slice
+        :rtype: Iterator[None]
+        """
+
+        def _priority(segment: Tuple[Optional[sg.Element], List[Operation]]) -> int:
+            element, operations = segment
+            if element is None or element is focus:
+                return 0
+            if any(
+                isinstance(operation.gate, VisibilityGate) for operation in operations
+            ):
+                return 2
+            return 1
+
+        run = self._batched if batch else self._direct
+        gates: Optional[Dict[Gate, bool]] = None if colorizer.progress >= 1 else {}
+        deadline = perf_counter() + budget / 1000
+        for element, operations in sorted(self.segments, key=_priority):
+            if element is not None and before_element:
+                before_element(element, colorizer)
+            run(self._open(operations, gates), colorizer)
+            if element is not None and after_element:
+                after_element(element, colorizer)
+            if perf_counter() >= deadline:
+                yield
+                deadline = perf_counter() + budget / 1000
+
+    @staticmethod
+    def _open(
+        operations: List[Operation], gates: Optional[Dict[Gate, bool]]
+    ) -> List[Operation]:
+        """
+        Filters out the operations whose targets aren't showing.
+
+        :param operations: The operations to filter
+        :type operations: List[Operation]
+        :param gates: The results of the gates checked so far this frame, or None to
+            keep every operation (on the final frame)
+        :type gates: Optional[Dict[Gate, bool]]
+        :return: The operations to run this frame
+        :rtype: List[Operation]
+        """
+        if gates is None:
+            return operations
+        opened = []
+        for operation in operations:
+            gate = operation.gate
+            if gate is not None:
+                if gate not in gates:
+                    gates[gate] = bool(gate())
+                if not gates[gate]:
+                    continue
+            opened.append(operation)
+        return opened
+
+    def _changes(
+        self,
+        operation: Operation,
+        values: Dict[Any, str],
+        applied: Dict[Tuple[Hashable, Any], str],
+        count: bool = True,
+    ) -> Dict[Any, str]:
+        """
+        Filters out the values that are identical to those last applied.
+
+        :param count: Whether to add what's skipped to ``skipped_calls`` and
+            ``skipped_values``
+        :type count: bool
+        :return: The values that need to be applied; empty if the call can be skipped
+        :rtype: Dict[Any, str]
+        """
+        target = operation.target
+        changes = {}
+        for attribute, value in values.items():
+            slot = (target, attribute)
+            if applied.get(slot) != value:
+                applied[slot] = value
+                changes[attribute] = value
+
+        if not changes:
+            if count:
+                self.skipped_calls += 1
+                self.skipped_values += len(values)
+            return changes
+        if not operation.partial:
+            return values
+        if count:
+            self.skipped_values += len(values) - len(changes)
+        return changes
+
+    def _direct(self, operations: List[Operation], colorizer: Colorizer) -> None:
+        for operation in operations:
+            values = self._changes(operation, operation.values(colorizer), self.applied)
+            if values:
+                operation.run(values)
+
+    def _batched(self, operations: List[Operation], colorizer: Colorizer) -> None:
+        script: List[str] = []
+        for operation in operations:
+            values = self._changes(operation, operation.values(colorizer), self.applied)
+            if not values:
+                continue
+            words = operation.command(values)
+            if words is None:
+                # Keep the order of updates by flushing the script collected so far.
+                self._evaluate(script)
+                script = []
+                operation.run(values)
+            else:
+                script.append(_tcl_command(words))
+        self._evaluate(script)
+
+    def script(self, colorizer: Colorizer) -> str:
+        """
+        Generates a Tcl script applying the plan with the current palette's colors.
+
+        Operations that can't be expressed in Tcl, and gated operations (whose targets
+        may not be showing when the script runs), are left out of intermediate frames;
+        they have to be applied separately (e.g. on the final frame, with ``apply``).
+        Values applied afterwards with ``apply`` are all sent to Tk again.
+
+        :param colorizer: The colorizer supplying the colors of the frame
+        :type colorizer: Colorizer
+        :return: The Tcl script
+        :rtype: str
+        """
+        commands = []
+        # Frames played back by Tcl may be skipped, so values are only deduplicated
+        # within the frame, rather than against previously applied ones. Which values
+        # end up on screen is then unknown, so the record of applied values (shared
+        # with the plans this one was selected from or for) is dropped.
+        self.applied.clear()
+        applied: Dict[Tuple[Hashable, Any], str] = {}
+        final = colorizer.progress >= 1
+        for operation in self.operations:
+            if operation.gate is not None and not final:
+                continue
+            values = self._changes(
+                operation, operation.values(colorizer), applied, count=False
+            )
+            words = operation.command(values) if values else None
+            if words is not None:
+                commands.append(_tcl_command(words))
+        return "\n".join(commands)
+
+    def _evaluate(self, script: List[str]) -> None:
+        if script:
+            self.styler.tk.eval("\n".join(script))
+
+    # Builders
+
+    def path(
+        self,
+        tk: Any,
+        path: str,
+        configuration: ThemeConfiguration,
+        default_color_function: Callable[[str], str],
+        gate: Optional[Gate] = None,
+    ) -> None:
+        """Records the configuration of a widget known only by its Tk path name."""
+        self.add(
+            WidgetOperation(
+                tk, path, _bind(configuration, default_color_function), gate
+            )
+        )
+
+    def widget(
+        self,
+        widget: Misc,
+        configuration: ThemeConfiguration,
+        default_color_function: Callable[[str], str],
+    ) -> None:
+        self.path(widget.tk, str(widget), configuration, default_color_function)
+
+    def element(self, element: sg.Element, configuration: ThemeConfiguration) -> None:
+        self.widget(
+            element.widget,
+            configuration,
+            partial(_default_element_cget, type(element)),
+        )
+
+    def window(self, window: sg.Window, configuration: ThemeConfiguration) -> None:
+        if window.TKroot:
+            self.widget(window.TKroot, configuration, _default_window_cget)
+
+    def style(
+        self,
+        style: str,
+        configuration: ThemeConfiguration,
+        default_style: str,
+        fallback: str = "black",
+    ) -> None:
+        self.add(
+            StyleOperation(
+                self.styler,
+                style,
+                _bind(
+                    configuration,
+                    lambda attribute: self.styler.lookup(
+                        default_style, attribute, default=fallback
+                    ),
+                ),
+            )
+        )
+
+    def map(
+        self,
+        style: str,
+        configurations: Dict[str, ThemeConfiguration],
+        default_style: str,
+        pass_state: bool = False,
+        fallback: str = "black",
+    ) -> None:
+        self.add(
+            StyleMapOperation(
+                self.styler,
+                style,
+                [
+                    (
+                        (option, state),
+                        key,
+                        partial(
+                            self.styler.lookup,
+                            default_style,
+                            option,
+                            [state] if pass_state else None,
+                            fallback,
+                        ),
+                    )
+                    for option, configuration in configurations.items()
+                    for state, key in configuration.items()
+                ],
+            )
+        )
+
+    def menu_entry(
+        self,
+        menu: TKMenu,
+        index: int,
+        configuration: ThemeConfiguration,
+        default_color_function: Callable[[str], str],
+        gate: Optional[Gate] = None,
+    ) -> None:
+        self.add(
+            MenuEntryOperation(
+                menu, index, _bind(configuration, default_color_function), gate
+            )
+        )
+
+    def tag(
+        self,
+        treeview: TTKTreeview,
+        tag: Any,
+        configuration: ThemeConfiguration,
+        default_color_function: Callable[[str], str],
+    ) -> None:
+        self.add(
+            TagOperation(treeview, tag, _bind(configuration, default_color_function))
+        )
+
+    def attributes(
+        self,
+        target: Any,
+        configuration: ThemeConfiguration,
+        default_color_function: Callable[[str], str],
+    ) -> None:
+        self.add(
+            AttributeOperation(target, _bind(configuration, default_color_function))
+        )
+
+    def configure(
+        self,
+        configuration: ThemeConfiguration,
+        func_to_apply_configurations: Callable[..., Any],
+        func_to_get_default_color: Callable[[str], str],
+        gate: Optional[Gate] = None,
+    ) -> None:
+        self.add(
+            CallbackOperation(
+                func_to_apply_configurations,
+                _bind(configuration, func_to_get_default_color),
+                gate,
+            )
+        )
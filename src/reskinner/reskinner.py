@@ -1,12 +1,42 @@
-from datetime import datetime, timedelta
+from concurrent.futures import Future
+from inspect import signature
+from itertools import chain
+from queue import SimpleQueue
+from threading import Lock, Thread
 from tkinter import TclError
-from typing import Callable, Dict, Optional, TypeVar, Union
-from warnings import warn
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from ._compat import Literal
+from .animation import (
+    CompletionCallback,
+    CrossfadeTransition,
+    TclTransition,
+    Transition,
+    _check_frame_rate,
+    _frame_count,
+)
 from .colorizer import Colorizer, ThemeDict
+from .constants import (
+    CROSSFADE_ELEMENT_THRESHOLD,
+    CROSSFADE_FRAME_COST_THRESHOLD,
+    DEFAULT_CPU_BUDGET,
+    DEFAULT_FPS,
+)
 from .easing import EasingName
 from .elements import ElementReskinner
+from .plan import ReskinPlan
 from .sg import sg
 
 # Type variable for PySimpleGUI elements
@@ -21,6 +51,44 @@ ElementCallback = Callable[[sg.Element, Colorizer], None]
 # Element reskinner instance
 _element_reskinner = ElementReskinner()
 
+# The transition running (or about to) on each window. Transitions reference their
+# windows, so they're removed once done; the windows could never be collected otherwise.
+_active_transitions: "WeakKeyDictionary[sg.Window, Transition]" = WeakKeyDictionary()
+
+
+class _TransitionState:
+    """What a color-interpolating transition started by ``reskin()`` was built from."""
+
+    __slots__ = ("colorizer", "options", "plan")
+
+    def __init__(self, colorizer: Colorizer, options: Tuple[Any, ...]):
+        self.colorizer = colorizer
+        # The arguments of `_compile_windows()` the plan is built with
+        self.options = options
+        # The full compiled plan (before selecting changed keys), once compiled
+        self.plan: Optional[ReskinPlan] = None
+
+
+# What each in-flight transition was built from, so that it can be retargeted
+_transition_states: "WeakKeyDictionary[Transition, _TransitionState]" = (
+    WeakKeyDictionary()
+)
+
+# The last measured frame cost of color-interpolating transitions on each window
+_frame_costs: "WeakKeyDictionary[sg.Window, float]" = WeakKeyDictionary()
+
+# Type alias for reskin requests made from other threads: the theme, the other
+# arguments of `reskin()`, and the future resolved with the transition handle
+ReskinRequest = Tuple[str, Dict[str, Any], "Future[Transition]"]
+
+# Reskin requests queued by other threads, by window
+_requests: "WeakKeyDictionary[sg.Window, List[ReskinRequest]]" = WeakKeyDictionary()
+_requests_lock = Lock()
+
+# Windows whose GUI thread needs waking up to run their queued requests
+_wake_queue: "SimpleQueue[sg.Window]" = SimpleQueue()
+_waker: Optional[Thread] = None
+
 
 def reskin(
     window: sg.Window,
@@ -35,7 +103,19 @@ def reskin(
     easing_function: Optional[Union[EasingName, Callable[[float], float]]] = None,
     before_element: Optional[ElementCallback] = None,
     after_element: Optional[ElementCallback] = None,
-) -> None:
+    fps: float = DEFAULT_FPS,
+    on_complete: Optional[CompletionCallback] = None,
+    completion_event: Optional[Any] = None,
+    batch: bool = False,
+    playback: Literal["python", "tcl"] = "python",  # noqa: F821
+    shared_styles: bool = False,
+    cull_hidden: bool = True,
+    time_slice: Optional[float] = None,
+    cpu_budget: float = DEFAULT_CPU_BUDGET,
+    transition_mode: Literal["interpolate", "crossfade", "auto"] = "interpolate",  # noqa: F821
+    level_of_detail: Union[bool, ElementFilter] = True,
+    debounce: float = 0,
+) -> Transition:
     """Apply a new theme to a PySimpleGUI or FreeSimpleGUI window with optional animation.
 
     This function enables dynamic theme switching for GUI windows built with
@@ -43,6 +123,14 @@ def reskin(
     or re-instantiate the window or its elements. It optionally supports smooth
     animated transitions using RGB, HSL, or hue-based color interpolation.
 
+    Animated transitions don't block: frames are scheduled on the window's Tk event
+    loop with ``after()``, so they play out while the window is being read. The
+    returned handle can be used to cancel the transition, skip to its end, or check
+    whether it is done. Reskinning a window while a transition is still running on
+    it retargets it: the running transition is cancelled, and the new one starts
+    from the colors on screen, without compiling the window again. Cross-fades are
+    finished first instead.
+
     :param window: The PySimpleGUI window to reskin
     :type window: sg.Window
     :param new_theme: Name of the theme to apply
@@ -67,19 +155,200 @@ def reskin(
         Signature: (element, colorizer) -> None.
     :param after_element: Optional callback called after reskinning each element.
         Signature: (element, colorizer) -> None.
+    :param fps: Maximum frame rate of animated transitions. The actual rate adapts to
+        the measured cost of a frame (see ``cpu_budget``)
+    :type fps: float
+    :param on_complete: Optional callback called with the transition handle once the
+        transition completes. Signature: (transition) -> None.
+    :type on_complete: Optional[CompletionCallback]
+    :param completion_event: Optional event key written to the window once the
+        transition completes, with the transition handle as its value
+    :type completion_event: Optional[Any]
+    :param batch: If True, collect each frame's Tk updates into a single Tcl script
+        evaluated in one go, which greatly reduces the per-frame cost on large windows
+    :type batch: bool
+    :param playback: Where animated frames are played back. With "tcl", every frame
+        is precomputed up front and played by the Tcl interpreter, so the animation
+        stays smooth while Python is busy; element callbacks then only run on the
+        final frame.
+    :type playback: Literal["python", "tcl"]
+    :param shared_styles: If True, ttk widgets whose styles are identical (e.g. most
+        buttons and scrollbars) are rebound to shared styles, so that each group is
+        recolored with a single style update per frame. Colors later set through the
+        elements' ``update()`` methods don't apply to the shared styles.
+    :type shared_styles: bool
+    :param cull_hidden: If True, widgets that aren't viewable (e.g. in unselected tabs,
+        hidden elements or minimized windows) skip the intermediate frames of animated
+        transitions, and get their colors once shown or on the final frame
+    :type cull_hidden: bool
+    :param time_slice: Optional time budget in milliseconds. When set, the final frame
+        (the whole reskin, if instant) is applied in slices of about that long, with
+        pending events processed in between, starting with the focused element and
+        visible widgets. Compiling the windows, when not done yet, is sliced too. The
+        transition is done once every slice has been applied.
+    :type time_slice: Optional[float]
+    :param cpu_budget: Fraction (0 to 1) of the main thread's time that rendering the
+        frames of animated transitions may take. Frames that cost more are spaced out,
+        so large windows get fewer frames instead of overrunning ``duration``
+    :type cpu_budget: float
+    :param transition_mode: How animated transitions are rendered. "interpolate"
+        interpolates the colors of every widget. "crossfade" fades the window out,
+        applies the new theme at once and fades it back in, at the cost of a single
+        alpha update per frame regardless of the number of elements (``playback`` and
+        ``interpolation_mode`` don't apply). "auto" cross-fades windows with many
+        elements, or whose frames were measured to be too costly to interpolate.
+    :type transition_mode: Literal["interpolate", "crossfade", "auto"]
+    :param level_of_detail: If True, only large surfaces animate: menus, separators
+        and sizegrips, along with the scrollbars, popup menus and table headings of
+        other elements, snap to the final frame. A function returning whether a given
+        element should snap may be passed instead, and False animates everything.
+        Elements whose metadata is a dict may override this with the "reskinner_lod"
+        key, set to either "animate" or "snap".
+    :type level_of_detail: Union[bool, ElementFilter]
+    :param debounce: Delay in milliseconds before the transition begins. Reskinning
+        the window again before then replaces this transition (which is cancelled),
+        so a burst of calls (e.g. while browsing a list of themes) results in a
+        single transition to the latest theme.
+    :type debounce: float
+    :return: A handle to the (possibly still running) transition
+    :rtype: Transition
 
     :raises ValueError: If the specified theme is not found
     :raises TclError: For Tkinter-related errors
     :raises RuntimeError: If theme reskinning initialization fails
     """
+    return _reskin_windows(
+        [window],
+        new_theme,
+        element_filter=element_filter,
+        theme_function=theme_function,
+        lf_table=lf_table,
+        set_future=set_future,
+        reskin_background=reskin_background,
+        duration=duration,
+        interpolation_mode=interpolation_mode,
+        easing_function=easing_function,
+        before_element=before_element,
+        after_element=after_element,
+        fps=fps,
+        on_complete=on_complete,
+        completion_event=completion_event,
+        batch=batch,
+        playback=playback,
+        shared_styles=shared_styles,
+        cull_hidden=cull_hidden,
+        time_slice=time_slice,
+        cpu_budget=cpu_budget,
+        transition_mode=transition_mode,
+        level_of_detail=level_of_detail,
+        debounce=debounce,
+    )
+
+
+def reskin_many(
+    windows: Iterable[sg.Window], new_theme: str, **kwargs: Any
+) -> Transition:
+    """Apply a new theme to several windows at once, with a single transition.
+
+    Takes the same arguments as ``reskin()``. Rather than playing a transition per
+    window, the windows are compiled into a single plan played by a single
+    transition: the palette of each frame is computed once, and each frame, scheduled
+    on the first window's event loop, updates every window before they're redrawn
+    together. The windows thus stay in step and all finish within ``duration``. ttk
+    styles, which are global to the Tk interpreter the windows share, are updated
+    once per frame however many windows use them. Cross-fades fade every window.
+
+    The completion event is written to the first window. Reskinning the same windows
+    again while the transition runs retargets it, as with ``reskin()``; reskinning
+    only some of them finishes it first.
+
+    :param windows: The windows to reskin
+    :type windows: Iterable[sg.Window]
+    :param new_theme: Name of the theme to apply
+    :type new_theme: str
+    :param kwargs: Any other argument of ``reskin()``
+    :return: A handle to the (possibly still running) transition of every window
+    :rtype: Transition
+    :raises ValueError: If no windows are given, or the specified theme is not found
+    """
+    windows = list(dict.fromkeys(windows))
+    if not windows:
+        raise ValueError("Expected at least one window to reskin")
+    return _reskin_windows(windows, new_theme, **kwargs)
+
+
+def _reskin_windows(
+    windows: List[sg.Window],
+    new_theme: str,
+    element_filter: Optional[ElementFilter] = None,
+    theme_function: Callable[..., str] = sg.theme,
+    lf_table: Optional[Dict[str, ThemeDict]] = None,
+    set_future: bool = True,
+    reskin_background: bool = True,
+    duration: float = 0,
+    interpolation_mode: Literal["hsl", "hue", "rgb"] = "rgb",  # noqa: F821
+    easing_function: Optional[Union[EasingName, Callable[[float], float]]] = None,
+    before_element: Optional[ElementCallback] = None,
+    after_element: Optional[ElementCallback] = None,
+    fps: float = DEFAULT_FPS,
+    on_complete: Optional[CompletionCallback] = None,
+    completion_event: Optional[Any] = None,
+    batch: bool = False,
+    playback: Literal["python", "tcl"] = "python",  # noqa: F821
+    shared_styles: bool = False,
+    cull_hidden: bool = True,
+    time_slice: Optional[float] = None,
+    cpu_budget: float = DEFAULT_CPU_BUDGET,
+    transition_mode: Literal["interpolate", "crossfade", "auto"] = "interpolate",  # noqa: F821
+    level_of_detail: Union[bool, ElementFilter] = True,
+    debounce: float = 0,
+) -> Transition:
+    """Reskin windows with a single transition, played on the first one's event loop.
+
+    See ``reskin()`` for the arguments.
+    """
     if lf_table is None:
         lf_table = sg.LOOK_AND_FEEL_TABLE
 
-    if not isinstance(window, sg.Window):
-        raise TypeError(f"Expected a PySimpleGUI Window, got {type(window).__name__}")
+    for window in windows:
+        if not isinstance(window, sg.Window):
+            raise TypeError(
+                f"Expected a PySimpleGUI Window, got {type(window).__name__}"
+            )
+    # The transition is played on the first window's event loop.
+    window = windows[0]
 
     if not isinstance(new_theme, str):
         raise TypeError(f"Theme name must be a string, got {type(new_theme).__name__}")
+
+    options = (
+        tuple(windows),
+        element_filter,
+        reskin_background,
+        shared_styles,
+        cull_hidden,
+        level_of_detail,
+    )
+
+    if not isinstance(duration, (int, float)) or duration < 0:
+        raise ValueError("Duration must be a non-negative number")
+
+    if time_slice is not None and (
+        not isinstance(time_slice, (int, float)) or time_slice <= 0
+    ):
+        raise ValueError("Time slice must be a positive number")
+
+    if not isinstance(debounce, (int, float)) or debounce < 0:
+        raise ValueError("Debounce interval must be a non-negative number")
+
+    if transition_mode not in ("interpolate", "crossfade", "auto"):
+        raise ValueError(f"Unknown transition mode: {transition_mode}")
+
+    if playback not in ("python", "tcl"):
+        raise ValueError(f"Unknown playback mode: {playback}")
+
+    _check_frame_rate(fps, cpu_budget)
+
     try:
         old_theme = theme_function()
         old_theme_dict: Optional[ThemeDict] = lf_table.get(old_theme)
@@ -102,64 +371,487 @@ def reskin(
             ) from e
         raise
 
+    # Settle any transition already running on these windows (only once the call is
+    # known to be valid), so that the current theme reflects what's actually on
+    # screen. Those that haven't begun yet (while debouncing) haven't changed
+    # anything, and are replaced. Color transitions that are in flight on the same
+    # windows are retargeted instead: the new transition starts from the colors on
+    # screen, and reuses the plan compiled for the previous one. Those already
+    # applying their final frame in slices are finished, since the colors on screen
+    # are then a mix of both themes.
+    retargeted: Optional[_TransitionState] = None
+    finished = False
+    for previous in dict.fromkeys(map(_active_transitions.get, windows)):
+        if previous is None:
+            continue
+        if not previous.started:
+            previous.cancel()
+            continue
+        state = _transition_states.get(previous)
+        if (
+            state is not None
+            and not previous.done
+            and not previous.finishing
+            and transition_mode != "crossfade"
+            and state.options[0] == options[0]
+        ):
+            if isinstance(previous, TclTransition):
+                # Tcl plays frames by itself; the one on screen is the one due now.
+                state.colorizer.progress = previous.progress
+            retargeted = state
+            previous.cancel()
+        else:
+            finished = finished or not previous.done
+            previous.finish()
+
+    if finished:
+        # Finishing a transition sets the theme it was going to.
+        old_theme = theme_function()
+        old_theme_dict = lf_table.get(old_theme, old_theme_dict)
+
+    if retargeted is not None:
+        old_theme_dict = retargeted.colorizer.snapshot()
     # Disregard redundant calls
-    if (old_theme == new_theme) and (new_theme_dict == old_theme_dict):
-        return
+    elif (old_theme == new_theme) and (new_theme_dict == old_theme_dict):
+        return Transition(
+            window,
+            lambda _: None,
+            lambda: None,
+            on_complete=on_complete,
+            completion_event=completion_event,
+        ).start()
 
     colorizer = Colorizer(
         old_theme_dict, new_theme_dict, interpolation_mode, easing_function
     )
+    state = _TransitionState(colorizer, options)
+
+    # The plan is compiled once the transition begins, so that debounced transitions
+    # which are replaced cost next to nothing.
+    compiled: Optional[ReskinPlan] = None
+
+    def _compiling(budget: Optional[float] = None) -> Iterator[None]:
+        """Compiles the full plan, in slices of the given budget if any."""
+        if state.plan is not None:
+            return
+        if (
+            retargeted is not None
+            and retargeted.plan is not None
+            and retargeted.options == options
+        ):
+            state.plan = retargeted.plan
+            return
+        plan = ReskinPlan()
+        yield from _compile_windows_in_slices(plan, *options, budget)
+        state.plan = plan
+
+    def _compiled() -> ReskinPlan:
+        nonlocal compiled
+        if compiled is None:
+            for _ in _compiling():
+                pass
+            # Only the attributes bound to theme keys that actually change are touched.
+            compiled = state.plan.select(colorizer.changed_keys)
+        return compiled
+
+    def _prepared() -> ReskinPlan:
+        # Transitions starting from colors midway through another are one-offs, whose
+        # frames aren't worth precomputing.
+        if (
+            duration
+            and transition_mode != "crossfade"
+            and retargeted is None
+            and colorizer.timeline is None
+        ):
+            colorizer.precompute(_frame_count(duration, fps))
+        return _compiled()
+
+    def _count_skipped(plan: ReskinPlan) -> None:
+        transition.skipped_calls = plan.skipped_calls
+        transition.skipped_values = plan.skipped_values
+
+    def _render_frame(progress: float) -> None:
+        plan = _prepared()
+        colorizer.progress = progress
+        plan.apply(colorizer, before_element, after_element, batch)
+        _count_skipped(plan)
+
+    def _render_final() -> Optional[Iterator[None]]:
+        if time_slice is None:
+            _render_frame(1)
+            if set_future:
+                theme_function(new_theme)
+            return None
+        return _render_final_in_slices()
+
+    def _render_final_in_slices() -> Iterator[None]:
+        # Compiling the plan (unless frames were rendered already) costs about as much
+        # as applying it, so it's sliced too.
+        yield from _compiling(time_slice)
+        plan = _prepared()
+        colorizer.progress = 1
+        focus = window.find_element_with_focus() if window.TKroot else None
+        for _ in plan.steps(
+            colorizer, time_slice, before_element, after_element, batch, focus
+        ):
+            _count_skipped(plan)
+            yield
+        _count_skipped(plan)
+        if set_future:
+            theme_function(new_theme)
+
+    if transition_mode == "auto":
+        transition_mode = _auto_transition_mode(window, _compiled())
+
+    if transition_mode == "crossfade":
+        swapped = False
+
+        def _render_swap() -> None:
+            nonlocal swapped
+            swapped = True
+            _render_frame(1)
+
+        def _render_faded_in() -> Optional[Iterator[None]]:
+            # Once swapped, the new theme is already applied in full.
+            if not swapped:
+                return _render_final()
+            if set_future:
+                theme_function(new_theme)
+            return None
+
+        transition: Transition = CrossfadeTransition(
+            window,
+            _render_swap,
+            _render_faded_in,
+            duration,
+            fps,
+            on_complete,
+            completion_event,
+            cpu_budget,
+            easing_function,
+            windows[1:],
+        )
+        return _register(transition, windows).start(debounce)
+
+    if playback == "tcl":
+
+        def _render_script(progress: float) -> str:
+            plan = _prepared()
+            colorizer.progress = progress
+            return plan.script(colorizer)
+
+        transition = TclTransition(
+            window,
+            _render_script,
+            _render_final,
+            duration,
+            fps,
+            on_complete,
+            completion_event,
+            cpu_budget,
+        )
+    else:
+        transition = Transition(
+            window,
+            _render_frame,
+            _render_final,
+            duration,
+            fps,
+            on_complete,
+            completion_event,
+            cpu_budget,
+        )
+    _transition_states[transition] = state
+    return _register(transition, windows).start(debounce)
+
+
+def _register(transition: Transition, windows: List[sg.Window]) -> Transition:
+    """Make a transition the active one of its windows, until it's done."""
+    _active_transitions.update(dict.fromkeys(windows, transition))
+    transition._on_done.append(lambda transition: _release(transition, windows))
+    return transition
+
+
+def _release(transition: Transition, windows: List[sg.Window]) -> None:
+    """Forget a transition once it's done, keeping its measured frame cost."""
+    for window in windows:
+        if _active_transitions.get(window) is transition:
+            del _active_transitions[window]
+    if transition.frame_cost is not None and not isinstance(
+        transition, CrossfadeTransition
+    ):
+        _frame_costs[transition.window] = transition.frame_cost
+
+
+async def reskin_async(window: sg.Window, new_theme: str, **kwargs: Any) -> Transition:
+    """Apply a new theme to a window from an asyncio event loop.
+
+    Takes the same arguments as ``reskin()``, but the transition is played by the
+    running asyncio event loop: frames are rendered between awaits (and the window
+    redrawn after each one), so other coroutines keep running while it plays, and
+    it plays even while nothing pumps the window's Tk event loop. Transitions on
+    different windows can be awaited together, e.g. with ``asyncio.gather()``.
+
+    Cancelling the awaiting task finishes the transition, so the window is left
+    entirely in the new theme, and then re-raises ``asyncio.CancelledError``.
+
+    :param window: The PySimpleGUI window to reskin
+    :type window: sg.Window
+    :param new_theme: Name of the theme to apply
+    :type new_theme: str
+    :param kwargs: Any other argument of ``reskin()``
+    :return: The handle of the completed (or finished) transition
+    :rtype: Transition
+    """
+    return await reskin(window, new_theme, **kwargs).play_async()
+
+
+def request_reskin(
+    window: sg.Window, new_theme: str, **kwargs: Any
+) -> "Future[Transition]":
+    """Request a reskin from any thread.
+
+    Takes the same arguments as ``reskin()``, but may be called from worker threads,
+    since Tk must only be used from the GUI thread. The colors of every frame of the
+    transition are precomputed on the calling thread; the request is then queued,
+    and the GUI thread is woken up (with ``after``) to start the transition, which is
+    all that's left to do there. The calling thread never waits for the GUI thread.
+
+    Requests queued before the GUI thread gets to them are coalesced: only the latest
+    one is started, and the futures of the others are resolved with its transition.
+
+    :param window: The PySimpleGUI window to reskin
+    :type window: sg.Window
+    :param new_theme: Name of the theme to apply
+    :type new_theme: str
+    :param kwargs: Any other argument of ``reskin()``
+    :return: A future resolved with the transition handle once the transition has
+        started (or with the exception raised by ``reskin()``). Cancelling it before
+        the GUI thread gets to the request drops the request.
+    :rtype: Future[Transition]
+    :raises TypeError: If the arguments don't match those of ``reskin()``
+    """
+    arguments = _RESKIN_SIGNATURE.bind(window, new_theme, **kwargs)
+    arguments.apply_defaults()
+    _precompute_timeline(**arguments.arguments)
+
+    future: Future[Transition] = Future()
+    with _requests_lock:
+        pending = _requests.setdefault(window, [])
+        pending.append((new_theme, kwargs, future))
+        wake = len(pending) == 1
+    if wake:
+        _wake(window)
+    return future
+
+
+def _precompute_timeline(
+    new_theme: str,
+    theme_function: Callable[..., str],
+    lf_table: Optional[Dict[str, ThemeDict]],
+    duration: float,
+    interpolation_mode: Literal["hsl", "hue", "rgb"],  # noqa: F821
+    easing_function: Optional[Union[EasingName, Callable[[float], float]]],
+    fps: float,
+    transition_mode: str,
+    **_: Any,
+) -> None:
+    """
+    Precompute the colors of every frame of a requested transition.
+
+    They're kept in the timeline cache, where ``reskin()`` finds them. This is only an
+    optimization; invalid requests are left for ``reskin()`` to report.
+    """
+    if not duration or transition_mode == "crossfade":
+        return
+    if lf_table is None:
+        lf_table = sg.LOOK_AND_FEEL_TABLE
+    old_theme_dict = lf_table.get(theme_function())
+    new_theme_dict = lf_table.get(new_theme)
+    if not old_theme_dict or not new_theme_dict:
+        return
+    try:
+        colorizer = Colorizer(
+            old_theme_dict, new_theme_dict, interpolation_mode, easing_function
+        )
+        colorizer.precompute(_frame_count(duration, fps))
+    except (KeyError, TypeError, ValueError):
+        return
+
 
-    if duration:
-        if not isinstance(duration, (int, float)) or duration < 0:
-            raise ValueError("Duration must be a non-negative number")
+def _wake(window: sg.Window) -> None:
+    """Wake a window's GUI thread up to run its queued requests, without waiting."""
+    global _waker
+    _wake_queue.put(window)
+    with _requests_lock:
+        if _waker is None:
+            # Calls into Tk from other threads wait for the GUI thread to handle them,
+            # which is left to this thread rather than the requesting ones.
+            _waker = Thread(target=_run_waker, name="reskinner-waker", daemon=True)
+            _waker.start()
 
-        delta = timedelta(milliseconds=duration)
-        start = datetime.now()
-        end = start + delta
 
+def _run_waker() -> None:
+    while True:
+        window = _wake_queue.get()
         try:
-            while datetime.now() <= end:
-                elapsed = datetime.now() - start
-                colorizer.progress = min(
-                    1.0, elapsed.total_seconds() / delta.total_seconds()
-                )
-                try:
-                    _reskin(
-                        colorizer,
-                        window,
-                        element_filter,
-                        reskin_background,
-                        before_element,
-                        after_element,
-                    )
-                    window.refresh()  # Ensure UI updates during animation
-                except TclError as e:
-                    if "invalid command name" in str(e):
-                        message = "Window was closed during reskinning"
-                        warn(message)
-                        return
-                    raise  # Re-raise other TclErrors
-
-                if window.TKroot:
-                    window.TKroot.update_idletasks()
-
-        except Exception as e:
-            warn(f"Error during animated reskin: {str(e)}")
-            raise
-
-    colorizer.progress = 1
-    _reskin(
-        colorizer,
-        window,
+            window.TKroot.tk.willdispatch()
+            window.TKroot.after(0, lambda window=window: _run_requests(window))
+        except (AttributeError, RuntimeError, TclError) as e:
+            with _requests_lock:
+                pending = _requests.pop(window, [])
+            for _, _, future in pending:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+
+
+def _run_requests(window: sg.Window) -> None:
+    """Start the reskins queued for a window, on its GUI thread."""
+    with _requests_lock:
+        pending = _requests.pop(window, [])
+    futures = [
+        future for _, _, future in pending if future.set_running_or_notify_cancel()
+    ]
+    if not futures:
+        return
+    # Only the latest request that wasn't cancelled is started.
+    new_theme, kwargs, _ = next(
+        request for request in reversed(pending) if request[2] is futures[-1]
+    )
+    try:
+        transition = reskin(window, new_theme, **kwargs)
+    except Exception as e:
+        for future in futures:
+            future.set_exception(e)
+        return
+    for future in futures:
+        future.set_result(transition)
+
+
+def _auto_transition_mode(
+    window: sg.Window, plan: ReskinPlan
+) -> Literal["interpolate", "crossfade"]:  # noqa: F821
+    """
+    Pick how to animate a window's transition, based on its size and past frame cost.
+
+    :param window: The window to reskin
+    :type window: sg.Window
+    :param plan: The compiled plan of the reskin
+    :type plan: ReskinPlan
+    :return: "crossfade" if interpolating colors would likely be too slow
+    :rtype: Literal["interpolate", "crossfade"]
+    """
+    if len(plan.segments) - 1 > CROSSFADE_ELEMENT_THRESHOLD:
+        return "crossfade"
+    if _frame_costs.get(window, 0) > CROSSFADE_FRAME_COST_THRESHOLD:
+        return "crossfade"
+    return "interpolate"
+
+
+# The signature of `reskin()`, against which requests from other threads are checked
+_RESKIN_SIGNATURE = signature(reskin)
+
+
+def compile_plan(
+    window: sg.Window,
+    element_filter: Optional[ElementFilter] = None,
+    reskin_background: bool = True,
+    shared_styles: bool = False,
+    cull_hidden: bool = True,
+    level_of_detail: Union[bool, ElementFilter] = True,
+) -> ReskinPlan:
+    """Discover everything that reskinning a window involves, once.
+
+    Walking the window's elements, filtering them, dispatching them to their handlers
+    and probing their widgets all happen here. The resulting plan is a flat list of
+    operations (widget configures, ttk style configure/map calls, menu entries,
+    treeview tags...) bound to theme color keys, which can be replayed on every frame
+    of a transition with no further introspection.
+
+    :param window: Window to compile a plan for
+    :type window: sg.Window
+    :param element_filter: Optional function to filter elements
+    :type element_filter: Optional[ElementFilter]
+    :param reskin_background: Whether to reskin the window background
+    :type reskin_background: bool
+    :param shared_styles: Whether to rebind ttk widgets with identical styles to
+        shared styles
+    :type shared_styles: bool
+    :param cull_hidden: Whether to defer updates of widgets that aren't viewable to
+        the final frame (or until they're shown)
+    :type cull_hidden: bool
+    :param level_of_detail: Whether (or, given a function, which elements) to snap
+        small widgets and details to the final frame instead of animating them
+    :type level_of_detail: Union[bool, ElementFilter]
+    :return: The compiled plan
+    :rtype: ReskinPlan
+    """
+    return _compile_windows(
+        (window,),
+        element_filter,
+        reskin_background,
+        shared_styles,
+        cull_hidden,
+        level_of_detail,
+    )
+
+
+def _compile_windows(
+    windows: Tuple[sg.Window, ...],
+    element_filter: Optional[ElementFilter],
+    reskin_background: bool,
+    shared_styles: bool,
+    cull_hidden: bool,
+    level_of_detail: Union[bool, ElementFilter],
+) -> ReskinPlan:
+    """Compile a single plan reskinning several windows; see ``compile_plan()``."""
+    plan = ReskinPlan()
+    for _ in _compile_windows_in_slices(
+        plan,
+        windows,
         element_filter,
         reskin_background,
-        before_element,
-        after_element,
+        shared_styles,
+        cull_hidden,
+        level_of_detail,
+    ):
+        pass
+    return plan
+
+
+def _compile_windows_in_slices(
+    plan: ReskinPlan,
+    windows: Tuple[sg.Window, ...],
+    element_filter: Optional[ElementFilter],
+    reskin_background: bool,
+    shared_styles: bool,
+    cull_hidden: bool,
+    level_of_detail: Union[bool, ElementFilter],
+    budget: Optional[float] = None,
+) -> Iterator[None]:
+    """
+    Compile several windows into a plan, yielding whenever a slice's budget runs out.
+
+    The plan is complete once the iterator is exhausted; see ``compile_plan()``.
+    """
+    # Window level changes
+    if reskin_background:
+        for window in windows:
+            plan.window(window, {"background": "BACKGROUND"})
+
+    # Handle element filtering
+    elements = chain.from_iterable(window.element_list() for window in windows)
+    whitelist = (
+        filter(element_filter, elements) if element_filter is not None else elements
     )
 
-    if set_future:
-        theme_function(new_theme)
+    # Per-element changes happen henceforth; styles and menus shared between the
+    # windows' elements are only recorded once. Compilations sliced with others in
+    # between need an element reskinner of their own.
+    element_reskinner = _element_reskinner if budget is None else ElementReskinner()
+    yield from element_reskinner.compile_steps(
+        whitelist, plan, shared_styles, cull_hidden, level_of_detail, budget
+    )
 
 
 def _reskin(
@@ -183,26 +875,9 @@ def _reskin(
     :param before_element: Optional callback before each element is reskinned
     :param after_element: Optional callback after each element is reskinned
     """
-    # Window level changes
-    if reskin_background:
-        colorizer.window(window, {"background": "BACKGROUND"})
-
-    # Handle element filtering
-    whitelist = (
-        filter(element_filter, window.element_list())
-        if element_filter is not None
-        else window.element_list()
-    )
-
-    _element_reskinner.update_colorizer(colorizer)
-
-    # Per-element changes happen henceforth
-    for element in whitelist:
-        if before_element:
-            before_element(element, colorizer)
-        _element_reskinner.reskin_element(element)
-        if after_element:
-            after_element(element, colorizer)
+    compile_plan(window, element_filter, reskin_background).select(
+        colorizer.changed_keys
+    ).apply(colorizer, before_element, after_element)
 
 
 def toggle_transparency(window: sg.Window) -> None: